@@ -19,6 +19,27 @@ from .base_tool import BaseTool, register_tool
 from .utils import PlaceholderEntry, browse_file_with_context, save_file_with_context
 
 
+# Neon palette for rectangle outlines
+NEON_PALETTE = [
+    (255, 20, 147),   # DeepPink
+    (0, 255, 255),    # Cyan
+    (57, 255, 20),    # Neon Green
+    (255, 105, 180),  # HotPink
+    (255, 0, 255),    # Magenta
+    (255, 255, 0),    # Yellow
+    (0, 191, 255),    # DeepSkyBlue
+    (255, 140, 0),    # DarkOrange
+    (173, 255, 47),   # GreenYellow
+    (0, 255, 127),    # SpringGreen
+]
+
+# Precomputed (color, glow) hex pairs for each palette entry
+NEON_COLORS = [
+    (f"#{r:02x}{g:02x}{b:02x}", f"#{r // 3:02x}{g // 3:02x}{b // 3:02x}")
+    for r, g, b in NEON_PALETTE
+]
+
+
 @register_tool
 class HotspotEditorTool(BaseTool):
     @property
@@ -550,8 +571,7 @@ class HotspotEditorTab(ttk.Frame):
                                          flags))
 
     def _rebuild_tree(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         for i in range(len(self.rects)):
             self._add_tree_item(i)
 
@@ -789,23 +809,7 @@ class HotspotEditorTab(ttk.Frame):
 
     # ----- Colors & detection -----
     def _random_neon_color(self):
-        # Pick from a neon palette
-        palette = [
-            (255, 20, 147),   # DeepPink
-            (0, 255, 255),    # Cyan
-            (57, 255, 20),    # Neon Green
-            (255, 105, 180),  # HotPink
-            (255, 0, 255),    # Magenta
-            (255, 255, 0),    # Yellow
-            (0, 191, 255),    # DeepSkyBlue
-            (255, 140, 0),    # DarkOrange
-            (173, 255, 47),   # GreenYellow
-            (0, 255, 127),    # SpringGreen
-        ]
-        r, g, b = random.choice(palette)
-        color = f"#{r:02x}{g:02x}{b:02x}"
-        glow = f"#{max(0, r//3):02x}{max(0, g//3):02x}{max(0, b//3):02x}"
-        return color, glow
+        return random.choice(NEON_COLORS)
 
     def _auto_detect_grid_cells(self):
         if not self.image:
@@ -813,23 +817,27 @@ class HotspotEditorTab(ttk.Frame):
             return
         g = max(1, int(self.grid_size.get()))
         iw, ih = self.image.size
-        alpha = self.image.split()[3]
-        thr = int(self.alpha_threshold.get())
+        alpha = self.image.getchannel("A")
+        thr = max(0, int(self.alpha_threshold.get()))
+        # Threshold the whole alpha once (C-level LUT) instead of per cell
+        mask = alpha.point(bytes(255 if i > thr else 0 for i in range(256)))
+        if mask.getbbox() is None:
+            self.status.config(text="Auto-detected 0 grid cells")
+            return
+        # Find which grid rows/columns hold any opaque pixel so empty bands are skipped
+        col_live = [mask.crop((x, 0, min(x + g, iw), ih)).getbbox() is not None for x in range(0, iw, g)]
         added = 0
         # Clear previous temp selection
         for y in range(0, ih, g):
-            for x in range(0, iw, g):
+            y1 = min(y + g, ih)
+            if mask.crop((0, y, iw, y1)).getbbox() is None:
+                continue
+            for ix, x in enumerate(range(0, iw, g)):
+                if not col_live[ix]:
+                    continue
                 x1 = min(x + g, iw)
-                y1 = min(y + g, ih)
-                region = alpha.crop((x, y, x1, y1))
                 # Check if any pixel > thr
-                # Using getbbox on a thresholded mask for speed
-                if thr <= 0:
-                    bbox = region.getbbox()
-                else:
-                    # Create a binary mask by point() mapping
-                    mask = region.point(lambda p: 255 if p > thr else 0)
-                    bbox = mask.getbbox()
+                bbox = mask.crop((x, y, x1, y1)).getbbox()
                 if bbox is not None:
                     color, glow = self._random_neon_color()
                     rect = {
@@ -842,3 +850,5 @@ class HotspotEditorTab(ttk.Frame):
         self._rebuild_tree()
         self._refresh_canvas_rects()
         self.status.config(text=f"Auto-detected {added} grid cells")
+        # Flush all queued tree/canvas changes in a single redraw
+        self.update_idletasks()
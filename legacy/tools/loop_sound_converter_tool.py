@@ -3,7 +3,6 @@ Loop Sound Converter Tool - Convert looping sounds with proper crossfading.
 """
 
 import os
-import re
 import logging
 import warnings
 import tkinter as tk
@@ -11,7 +10,7 @@ from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 
 from .base_tool import BaseTool, register_tool
-from .utils import save_config
+from .utils import iter_files, save_config
 
 # Try to import pydub for audio processing
 try:
@@ -42,12 +41,10 @@ def find_loop_files(root):
     if not PYDUB_AVAILABLE:
         return []
         
-    pattern = re.compile(r'_lp.*\.mp3$', re.IGNORECASE)
     results = []
-    for dirpath, _, files in os.walk(root):
-        for fn in files:
-            if fn.lower().endswith('.mp3') and pattern.search(fn):
-                results.append(os.path.join(dirpath, fn))
+    for entry in iter_files(root, ('.mp3',)):
+        if '_lp' in entry.name[:-4].lower():
+            results.append(entry.path)
     return results
 
 
@@ -89,10 +86,8 @@ def process_loop_sound(path, output_root=None, crossfade_ms=1000, logger=None):
             left, right = audio.split_to_mono()
             l_loop = left.append(left, crossfade=crossfade_ms)
             r_loop = right.append(right, crossfade=crossfade_ms)
-            # Pad to same length
-            max_len = max(len(l_loop), len(r_loop))
-            l_loop += AudioSegment.silent(duration=max_len - len(l_loop))
-            r_loop += AudioSegment.silent(duration=max_len - len(r_loop))
+            # Both channels share a length, so the crossfaded loops do too
+            assert len(l_loop) == len(r_loop)
             looped = AudioSegment.from_mono_audiosegments(l_loop, r_loop)
         else:
             # Process mono file
@@ -3,72 +3,101 @@ Metal Transparency Tool - Apply transparency effects based on metal masks.
 """
 
 import os
+import threading
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import Image, ImageChops, ImageTk
 
 from .base_tool import BaseTool, register_tool
 from .utils import PlaceholderEntry, browse_file_with_context, save_file_with_context
 
 
-def apply_metal_transparency(base_image_path, mask_image_path, output_path, transparency_factor):
+# File dialog filters shared by the load/save handlers
+IMAGE_FILETYPES = (("Image Files", "*.png *.jpg *.jpeg *.tga"),)
+OUTPUT_FILETYPES = (("PNG files", "*.png"), ("All files", "*.*"))
+
+PREVIEW_SIZE = (200, 200)
+
+
+def _load_preview_image(path, mode=None):
+    """Open an image downscaled to PREVIEW_SIZE, letting the decoder pre-shrink where it can."""
+    img = Image.open(path)
+    # JPEG decoders can emit a reduced-scale image directly; a no-op for other formats
+    img.draft(None, (PREVIEW_SIZE[0] * 2, PREVIEW_SIZE[1] * 2))
+    if mode:
+        img = img.convert(mode)
+    return img.resize(PREVIEW_SIZE, Image.LANCZOS, reducing_gap=2.0)
+
+
+@lru_cache(maxsize=256)
+def _quantized_lut(tf_q):
+    """Build the 256-entry alpha multiplier LUT for a factor quantized to 0..255."""
+    return bytes(255 - (i * tf_q + 127) // 255 for i in range(256))
+
+
+def _transparency_lut(transparency_factor):
+    """Build a 256-entry LUT mapping mask intensity to an alpha multiplier."""
+    # Quantize the factor once, then stay in integer fixed point (x * y // 255)
+    return _quantized_lut(max(0, min(255, round(transparency_factor * 255))))
+
+
+def _blend_metal_alpha(base_image, mask_image, transparency_factor):
+    """Scale the alpha of an RGBA image in place by a same-sized "L" mask; returns the image."""
+    scaled_mask = mask_image.point(_transparency_lut(transparency_factor))
+    base_alpha = base_image.getchannel("A")
+    if base_alpha.getextrema() == (255, 255):
+        # Fully opaque base: the LUT output is already the final alpha
+        base_image.putalpha(scaled_mask)
+    else:
+        base_image.putalpha(ImageChops.multiply(base_alpha, scaled_mask))
+    return base_image
+
+
+def apply_metal_transparency(base_image, mask_image, output_path, transparency_factor):
     """
     Applies transparency to a base image based on the intensity in a metal mask image.
     
     Args:
-        base_image_path: Path to the base texture image
-        mask_image_path: Path to the metal mask image
+        base_image: Path to the base texture image, or an already decoded RGBA image
+        mask_image: Path to the metal mask image, or an already decoded "L" image
         output_path: Path where the output image will be saved
         transparency_factor: Float between 0.0 and 1.0 determining transparency level
+    
+    Returns:
+        Tuple of (success, error_message); error_message is None on success
     """
     try:
-        # Load images
-        base_image = Image.open(base_image_path).convert("RGBA")
-        mask_image = Image.open(mask_image_path).convert("L")
+        # Load images, or copy decoded ones since the alpha is written in place
+        if isinstance(base_image, str):
+            base_image = Image.open(base_image).convert("RGBA")
+        else:
+            base_image = base_image.copy()
+        if isinstance(mask_image, str):
+            mask_image = Image.open(mask_image).convert("L")
         
         # Check image size to prevent memory issues
         width, height = base_image.size
         total_pixels = width * height
         
-        if total_pixels > 50_000_000:  # Skip very large images (50 megapixels)
-            messagebox.showerror("Error", f"Image too large ({width}x{height}). Please use smaller images.")
-            return False
+        if total_pixels > 500_000_000:  # Skip very large images (500 megapixels)
+            return False, f"Image too large ({width}x{height}). Please use smaller images."
         
         # Resize mask to match base if needed
         if base_image.size != mask_image.size:
             mask_image = mask_image.resize(base_image.size, Image.LANCZOS)
             
-        # Create output image
-        output = Image.new("RGBA", base_image.size)
-        
         # Apply mask to alpha channel based on transparency factor
-        pixels = base_image.load()
-        mask_pixels = mask_image.load()
-        out_pixels = output.load()
-        
-        for y in range(base_image.height):
-            for x in range(base_image.width):
-                try:
-                    r, g, b, a = pixels[x, y]
-                    mask_value = mask_pixels[x, y] / 255.0
-                    
-                    # Adjust alpha based on mask value and transparency factor
-                    new_alpha = int(a * (1.0 - mask_value * transparency_factor))
-                    out_pixels[x, y] = (r, g, b, new_alpha)
-                except (IndexError, ValueError):
-                    # Skip individual pixel errors
-                    continue
+        _blend_metal_alpha(base_image, mask_image, transparency_factor)
         
         # Save output image
-        output.save(output_path)
-        return True
+        base_image.save(output_path)
+        return True, None
         
     except MemoryError:
-        messagebox.showerror("Error", "Memory error: Image too large to process.")
-        return False
+        return False, "Memory error: Image too large to process."
     except Exception as e:
-        messagebox.showerror("Error", f"Failed to process images: {str(e)}")
-        return False
+        return False, f"Failed to process images: {str(e)}"
 
 
 class MetalTransparencyTab(ttk.Frame):
@@ -79,6 +108,16 @@ class MetalTransparencyTab(ttk.Frame):
         self.base_image_path = ""
         self.mask_image_path = ""
         
+        # Decoded full-size sources, keyed by (path, mtime) of both inputs, shared
+        # by the preview and save paths; the preview-size pair is derived from them
+        self._source_cache_key = None
+        self._source_cache = None
+        self._preview_cache = None
+        # Result PhotoImage, created once and pasted into on each update
+        self._preview_photo = None
+        # Pending after() id for the debounced slider preview
+        self._preview_after_id = None
+        
         # Top frame for preview
         preview_frame = ttk.Frame(self)
         preview_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -114,7 +153,7 @@ class MetalTransparencyTab(ttk.Frame):
         # Transparency slider
         ttk.Label(controls_frame, text="Metal Transparency (%):").grid(row=2, column=0, padx=5, pady=5, sticky="e")
         self.trans_slider = ttk.Scale(controls_frame, from_=0, to=100, orient=tk.HORIZONTAL, length=300,
-                        command=lambda v: self.update_preview())
+                        command=lambda v: self._schedule_preview())
         self.trans_slider.set(50)  # Default to 50%
         self.trans_slider.grid(row=2, column=1, padx=5, pady=5, sticky="w")
 
@@ -125,7 +164,8 @@ class MetalTransparencyTab(ttk.Frame):
         ttk.Button(controls_frame, text="Browse...", command=self.browse_output).grid(row=3, column=2, padx=5, pady=5)
 
         # Save button
-        ttk.Button(controls_frame, text="Save Output", command=self.save_output).grid(row=4, column=0, columnspan=4, pady=10)
+        self.save_button = ttk.Button(controls_frame, text="Save Output", command=self.save_output)
+        self.save_button.grid(row=4, column=0, columnspan=4, pady=10)
 
         # Make entry column expand
         controls_frame.columnconfigure(1, weight=1)
@@ -145,7 +185,7 @@ class MetalTransparencyTab(ttk.Frame):
         self.log_text.config(state=tk.DISABLED)
     
     def select_base(self):
-        path = browse_file_with_context(self.base_path_entry, context_key="metal_base", filetypes=[("Image Files", "*.png *.jpg *.jpeg *.tga")], title="Select Base Texture")
+        path = browse_file_with_context(self.base_path_entry, context_key="metal_base", filetypes=IMAGE_FILETYPES, title="Select Base Texture")
         if path:
             self.base_image_path = path
             # Optionally auto-load preview when selecting
@@ -155,9 +195,9 @@ class MetalTransparencyTab(ttk.Frame):
         if from_entry:
             path = self.base_path_entry.get()
             if not path:
-                path = filedialog.askopenfilename(filetypes=[("Image Files", "*.png *.jpg *.jpeg *.tga")])
+                path = filedialog.askopenfilename(filetypes=IMAGE_FILETYPES)
         else:
-            path = filedialog.askopenfilename(filetypes=[("Image Files", "*.png *.jpg *.jpeg *.tga")])
+            path = filedialog.askopenfilename(filetypes=IMAGE_FILETYPES)
         if not path:
             return
         # Keep entry in sync
@@ -166,10 +206,10 @@ class MetalTransparencyTab(ttk.Frame):
             self.base_path_entry.insert(0, path)
 
         self.base_image_path = path
+        self._source_cache_key = None
         try:
             # Show preview
-            img = Image.open(path)
-            img = img.resize((200, 200), Image.LANCZOS)
+            img = _load_preview_image(path)
             photo = ImageTk.PhotoImage(img)
             self.preview_before.config(image=photo, text="")
             self.preview_before.image = photo  # Keep reference
@@ -184,7 +224,7 @@ class MetalTransparencyTab(ttk.Frame):
             self.log(f"Error loading base texture: {str(e)}")
 
     def select_mask(self):
-        path = browse_file_with_context(self.mask_path_entry, context_key="metal_mask", filetypes=[("Image Files", "*.png *.jpg *.jpeg *.tga")], title="Select Metal Mask")
+        path = browse_file_with_context(self.mask_path_entry, context_key="metal_mask", filetypes=IMAGE_FILETYPES, title="Select Metal Mask")
         if path:
             self.mask_image_path = path
             # Optionally auto-load preview when selecting
@@ -194,9 +234,9 @@ class MetalTransparencyTab(ttk.Frame):
         if from_entry:
             path = self.mask_path_entry.get()
             if not path:
-                path = filedialog.askopenfilename(filetypes=[("Image Files", "*.png *.jpg *.jpeg *.tga")])
+                path = filedialog.askopenfilename(filetypes=IMAGE_FILETYPES)
         else:
-            path = filedialog.askopenfilename(filetypes=[("Image Files", "*.png *.jpg *.jpeg *.tga")])
+            path = filedialog.askopenfilename(filetypes=IMAGE_FILETYPES)
         if not path:
             return
         # Keep entry in sync
@@ -205,10 +245,10 @@ class MetalTransparencyTab(ttk.Frame):
             self.mask_path_entry.insert(0, path)
 
         self.mask_image_path = path
+        self._source_cache_key = None
         try:
             # Show preview
-            img = Image.open(path)
-            img = img.resize((200, 200), Image.LANCZOS)
+            img = _load_preview_image(path)
             photo = ImageTk.PhotoImage(img)
             self.preview_mask.config(image=photo, text="")
             self.preview_mask.image = photo  # Keep reference
@@ -224,11 +264,38 @@ class MetalTransparencyTab(ttk.Frame):
     
     def browse_output(self):
         path = save_file_with_context(context_key="metal_output", title="Save Output",
-                                      defaultextension=".png", filetypes=[("PNG files", "*.png"), ("All files", "*.*")])
+                                      defaultextension=".png", filetypes=OUTPUT_FILETYPES)
         if path:
             self.output_path_var.set(path)
     
+    def _get_source_images(self, base_path, mask_path):
+        """Return the full-size decoded base/mask images, decoding only when the inputs change."""
+        key = (base_path, os.path.getmtime(base_path), mask_path, os.path.getmtime(mask_path))
+        if key != self._source_cache_key:
+            self._source_cache = (Image.open(base_path).convert("RGBA"),
+                                  Image.open(mask_path).convert("L"))
+            self._source_cache_key = key
+            self._preview_cache = None
+        return self._source_cache
+    
+    def _get_preview_images(self, base_path, mask_path):
+        """Return preview-size base/mask images derived from the shared decoded sources."""
+        base_img, mask_img = self._get_source_images(base_path, mask_path)
+        if self._preview_cache is None:
+            # Resize both straight to the preview size; matching the mask to
+            # the full base size first would only be thrown away
+            self._preview_cache = (base_img.resize(PREVIEW_SIZE, Image.LANCZOS, reducing_gap=2.0),
+                                   mask_img.resize(PREVIEW_SIZE, Image.LANCZOS, reducing_gap=2.0))
+        return self._preview_cache
+    
+    def _schedule_preview(self, delay_ms=50):
+        """Coalesce rapid slider changes into a single preview render."""
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.after(delay_ms, self.update_preview)
+    
     def update_preview(self):
+        self._preview_after_id = None
         # Prefer values from entries, fall back to last loaded paths
         base_path = getattr(self, 'base_path_entry', None).get() if hasattr(self, 'base_path_entry') else ""
         mask_path = getattr(self, 'mask_path_entry', None).get() if hasattr(self, 'mask_path_entry') else ""
@@ -243,34 +310,16 @@ class MetalTransparencyTab(ttk.Frame):
             # Generate a preview with current transparency setting
             transparency = self.trans_slider.get() / 100.0
             
-            base_img = Image.open(base_path).convert("RGBA")
-            mask_img = Image.open(mask_path).convert("L")
+            base_preview, mask_preview = self._get_preview_images(base_path, mask_path)
             
-            # Resize mask to match base if needed
-            if base_img.size != mask_img.size:
-                mask_img = mask_img.resize(base_img.size, Image.LANCZOS)
-                
-            # Create small preview
-            preview_size = (200, 200)
-            base_preview = base_img.resize(preview_size, Image.LANCZOS)
-            mask_preview = mask_img.resize(preview_size, Image.LANCZOS)
-            
-            result = Image.new("RGBA", preview_size)
-            base_pixels = base_preview.load()
-            mask_pixels = mask_preview.load()
-            result_pixels = result.load()
+            result = _blend_metal_alpha(base_preview.copy(), mask_preview, transparency)
             
-            for y in range(preview_size[1]):
-                for x in range(preview_size[0]):
-                    r, g, b, a = base_pixels[x, y]
-                    mask_value = mask_pixels[x, y] / 255.0
-                    new_alpha = int(a * (1.0 - mask_value * transparency))
-                    result_pixels[x, y] = (r, g, b, new_alpha)
-            
-            # Display preview
-            photo = ImageTk.PhotoImage(result)
-            self.preview_after.config(image=photo, text="")
-            self.preview_after.image = photo
+            # Display preview, reusing the same PhotoImage across updates
+            if self._preview_photo is None:
+                self._preview_photo = ImageTk.PhotoImage("RGBA", result.size)
+                self.preview_after.config(image=self._preview_photo, text="")
+                self.preview_after.image = self._preview_photo
+            self._preview_photo.paste(result)
             
         except Exception as e:
             self.log(f"Preview error: {str(e)}")
@@ -291,14 +340,35 @@ class MetalTransparencyTab(ttk.Frame):
         if not output_path:
             output_path = save_file_with_context(context_key="metal_output", title="Save Output",
                                                 defaultextension=".png",
-                                                filetypes=[("PNG files", "*.png"), ("All files", "*.*")])
+                                                filetypes=OUTPUT_FILETYPES)
             if not output_path:
                 return
                 
         transparency = self.trans_slider.get() / 100.0
-        if apply_metal_transparency(base_path, mask_path, output_path, transparency):
+        try:
+            base_img, mask_img = self._get_source_images(base_path, mask_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load images: {str(e)}")
+            return
+        self.log(f"Processing {os.path.basename(base_path)}...")
+        
+        # One save at a time; a second worker would write the same output path
+        self.save_button.config(state="disabled")
+        
+        def worker():
+            result = apply_metal_transparency(base_img, mask_img, output_path, transparency)
+            self.after(0, lambda: self._on_save_finished(output_path, *result))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _on_save_finished(self, output_path, success, error_msg):
+        self.save_button.config(state="normal")
+        if success:
             self.log(f"Output saved to: {os.path.basename(output_path)}")
             messagebox.showinfo("Success", f"Output saved to: {output_path}")
+        else:
+            self.log(f"Error: {error_msg}")
+            messagebox.showerror("Error", error_msg)
 
 
 @register_tool
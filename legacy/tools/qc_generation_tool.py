@@ -3,41 +3,55 @@ QC Generation Tool - Generate QC files for Source models.
 """
 
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 from .base_tool import BaseTool, register_tool
-from .utils import PlaceholderEntry, determine_surfaceprop, save_config
+from .utils import PlaceholderEntry, determine_surfaceprop, iter_files, save_config
+
+
+# QC body shared by single and batch generation; filled in per SMD
+QC_TEMPLATE = (
+    '$modelname "{prefix}/{base}.mdl"\n'
+    '$body {base} "{base}.smd"\n\n'
+    '$staticprop\n'
+    '$contents "solid"\n'
+    '$surfaceprop "{surface}"\n'
+    '$illumposition 0 0 0\n\n'
+    '$cdmaterials "{materials}/"\n\n'
+    '$sequence {base} "{base}.smd" fps {fps}\n\n'
+)
+
+COLLISION_TEMPLATE = (
+    '$collisionmodel "{base}.smd"\n'
+    "{{\n"
+    "    $concave\n"
+    "    $automass\n"
+    "    $inertia 1\n"
+    "    $damping 0\n"
+    "    $rotdamping 0\n"
+    "}}\n"
+)
+
+QC_COLLISION_TEMPLATE = QC_TEMPLATE + COLLISION_TEMPLATE
+
+
+def build_qc_content(base, model_prefix, materials_path, surface, fps, append_collision):
+    """Build the QC text for one SMD, resolving "default" surfaces from its name."""
+    if not surface or surface == "default":
+        surface = determine_surfaceprop(base)
+    template = QC_COLLISION_TEMPLATE if append_collision else QC_TEMPLATE
+    return template.format(prefix=model_prefix, base=base, surface=surface,
+                           materials=materials_path, fps=fps)
 
 
 def generate_single_qc(smd_path, model_prefix, materials_path, surface, fps, append_collision):
     """Generate a QC file for a single SMD file."""
     d, f = os.path.split(smd_path)
     base, _ = os.path.splitext(f)
-    mdl = f"{model_prefix}/{base}.mdl"
-    if (surface == "default" or not surface):
-        surface = determine_surfaceprop(base)
-    content = (
-        f'$modelname "{mdl}"\n'
-        f'$body {base} "{base}.smd"\n\n'
-        '$staticprop\n'
-        '$contents "solid"\n'
-        f'$surfaceprop "{surface}"\n'
-        '$illumposition 0 0 0\n\n'
-        f'$cdmaterials "{materials_path}/"\n\n'
-        f'$sequence {base} "{base}.smd" fps {fps}\n\n'
-    )
-    if append_collision:
-        content += (
-            f'$collisionmodel "{base}.smd"\n'
-            "{\n"
-            "    $concave\n"
-            "    $automass\n"
-            "    $inertia 1\n"
-            "    $damping 0\n"
-            "    $rotdamping 0\n"
-            "}\n"
-        )
+    content = build_qc_content(base, model_prefix, materials_path, surface, fps, append_collision)
     qc = os.path.join(d, base + ".qc")
     try:
         with open(qc, "w", encoding="utf-8") as file:
@@ -47,44 +61,42 @@ def generate_single_qc(smd_path, model_prefix, materials_path, surface, fps, app
         messagebox.showerror("QC Gen", str(e))
 
 
+def _write_qc_dir(items):
+    """Write the (qc_path, content) pairs for one directory; returns the paths that failed."""
+    failed = []
+    for qc, content in items:
+        try:
+            # Encode up front (keeping platform newlines, as text mode would) and
+            # write the whole file in one unbuffered call
+            data = content.replace("\n", os.linesep).encode("utf-8")
+            with open(qc, "wb", buffering=0) as file:
+                file.write(data)
+        except Exception as e:
+            print(f"[ERROR] Could not create QC {os.path.basename(qc)}: {e}")
+            failed.append(qc)
+    return failed
+
+
 def generate_qc_batch(folder, model_prefix, materials_path, surface, fps, append_collision):
     """Generate QC files for all SMD files in a folder."""
-    cnt = 0
-    for r, _, files in os.walk(folder):
-        for fn in files:
-            if not fn.lower().endswith(".smd"):
-                continue
-            base, _ = os.path.splitext(fn)
-            surface_final = surface if surface and surface != "default" else determine_surfaceprop(base)
-            content = (
-                f'$modelname "{model_prefix}/{base}.mdl"\n'
-                f'$body {base} "{base}.smd"\n\n'
-                '$staticprop\n'
-                '$contents "solid"\n'
-                f'$surfaceprop "{surface_final}"\n'
-                '$illumposition 0 0 0\n\n'
-                f'$cdmaterials "{materials_path}/"\n\n'
-                f'$sequence {base} "{base}.smd" fps {fps}\n\n'
-            )
-            if append_collision:
-                content += (
-                    f'$collisionmodel "{base}.smd"\n'
-                    "{\n"
-                    "    $concave\n"
-                    "    $automass\n"
-                    "    $inertia 1\n"
-                    "    $damping 0\n"
-                    "    $rotdamping 0\n"
-                    "}\n"
-                )
-            qc = os.path.join(r, base + ".qc")
-            try:
-                with open(qc, "w", encoding="utf-8") as file:
-                    file.write(content)
-                cnt += 1
-            except Exception as e:
-                print(f"[ERROR] Could not create QC for {fn}: {e}")
-    messagebox.showinfo("QC Gen", f"Batch created {cnt} files.")
+    by_dir = defaultdict(list)
+    total = 0
+    for entry in iter_files(folder, (".smd",)):
+        stem = entry.path[:-4]
+        base = entry.name[:-4]
+        content = build_qc_content(base, model_prefix, materials_path, surface, fps, append_collision)
+        by_dir[os.path.dirname(stem)].append((stem + ".qc", content))
+        total += 1
+    # One task per directory keeps each worker's writes local; writes are
+    # I/O bound, so threads overlap the syscalls despite the GIL
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as ex:
+        failed = [qc for dir_failed in ex.map(_write_qc_dir, by_dir.values()) for qc in dir_failed]
+    if failed:
+        shown = "\n".join(failed[:10]) + ("\n..." if len(failed) > 10 else "")
+        messagebox.showwarning("QC Gen", f"Batch created {total - len(failed)} files.\n"
+                                         f"{len(failed)} failed:\n{shown}")
+    else:
+        messagebox.showinfo("QC Gen", f"Batch created {total} files.")
 
 
 class QcGenTab(ttk.Frame):
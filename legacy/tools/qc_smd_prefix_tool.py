@@ -3,6 +3,7 @@ QC/SMD Prefix Tool - Add prefixes to QC and SMD files for organization.
 """
 
 import os
+import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -10,6 +11,14 @@ from .base_tool import BaseTool, register_tool
 from .utils import PlaceholderEntry, browse_file_with_context, save_config
 
 
+# Read size used when streaming SMD files through the texture prefix rewrite
+SMD_CHUNK_SIZE = 1 << 20
+
+# Case-insensitive QC line classifiers, matching anywhere in the line
+MODELNAME_RE = re.compile(r'\$modelname', re.IGNORECASE)
+SMD_RE = re.compile(r'\.smd', re.IGNORECASE)
+
+
 def modify_qc_smd_files(qc_path, smd_path, model_prefix, texture_prefix):
     """Modify QC and SMD files with the specified prefixes."""
     if not os.path.exists(qc_path) or not os.path.exists(smd_path):
@@ -21,7 +30,7 @@ def modify_qc_smd_files(qc_path, smd_path, model_prefix, texture_prefix):
 
     new_qc_lines = []
     for line in qc_lines:
-        if "$modelname" in line.lower():
+        if MODELNAME_RE.search(line):
             parts = line.strip().split()
             if len(parts) >= 2:
                 path = parts[1].strip('"')
@@ -38,7 +47,7 @@ def modify_qc_smd_files(qc_path, smd_path, model_prefix, texture_prefix):
                 new_qc_lines.append(new_line)
             else:
                 new_qc_lines.append(line)
-        elif ".smd" in line.lower():
+        elif SMD_RE.search(line):
             smd_line = line.replace(".smd", f"{model_prefix}.smd")
             new_qc_lines.append(smd_line)
         else:
@@ -48,23 +57,37 @@ def modify_qc_smd_files(qc_path, smd_path, model_prefix, texture_prefix):
     with open(new_qc_path, "w") as out_qc:
         out_qc.writelines(new_qc_lines)
 
-    # Read and modify SMD file
-    with open(smd_path, "r") as smd_file:
-        smd_lines = smd_file.readlines()
-
-    new_smd_lines = []
-    for line in smd_lines:
-        if "materials/" in line.lower():
-            new_smd_lines.append(line.replace("materials/", f"materials/{texture_prefix}"))
-        else:
-            new_smd_lines.append(line)
-
     smd_dir = os.path.dirname(smd_path)
     smd_base = os.path.splitext(os.path.basename(smd_path))[0]
     new_smd_name = f"{smd_base}{model_prefix}.smd"
     new_smd_path = os.path.join(smd_dir, new_smd_name)
-    with open(new_smd_path, "w") as out_smd:
-        out_smd.writelines(new_smd_lines)
+
+    # Stream the SMD through in chunks so huge meshes never sit fully in memory.
+    # Chunks are cut at the last newline so a "materials/" never straddles two.
+    # Output goes to a temp file first since an empty prefix targets the source.
+    needle = b"materials/"
+    replacement = needle + texture_prefix.encode("utf-8")
+    tmp_smd_path = new_smd_path + ".tmp"
+    try:
+        with open(smd_path, "rb") as smd_file, open(tmp_smd_path, "wb") as out_smd:
+            carry = b""
+            while True:
+                chunk = smd_file.read(SMD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                buf = carry + chunk
+                cut = buf.rfind(b"\n") + 1
+                out_smd.write(buf[:cut].replace(needle, replacement))
+                carry = buf[cut:]
+            out_smd.write(carry.replace(needle, replacement))
+        os.replace(tmp_smd_path, new_smd_path)
+    except BaseException:
+        # Don't leave a half-written temp file next to the source SMD
+        try:
+            os.unlink(tmp_smd_path)
+        except OSError:
+            pass
+        raise
 
     return new_qc_path, new_smd_path
 
@@ -6,17 +6,261 @@ import os
 import re
 import logging
 import warnings
-import shutil
 import math
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 from .base_tool import BaseTool, register_tool
-from .utils import PlaceholderEntry, browse_folder
+from .utils import PlaceholderEntry, browse_folder, iter_files
+
+# Optional NumPy fast path for channel mixing; falls back to pydub overlays
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # Suppress pydub RuntimeWarnings about ffmpeg/ffprobe
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
+# Pattern 1: basename_l.mp3, basename_ls.mp3, basename_r.mp3, basename_rs.mp3
+_QUAD_RE = re.compile(r'(.+?)_(l|ls|r|rs)\.(mp3|wav)$', re.IGNORECASE)
+# Pattern 2: basename_front_l.wav, basename_front_r.wav, basename_rear_l.wav, basename_rear_r.wav
+_QUAD_POSITION_RE = re.compile(r'(.+?)_(front|rear)_(l|r)\.(mp3|wav)$', re.IGNORECASE)
+# Map front_l -> l, front_r -> r, rear_l -> ls, rear_r -> rs
+_POSITION_CHANNELS = {
+    ('front', 'l'): 'l',
+    ('front', 'r'): 'r',
+    ('rear', 'l'): 'ls',
+    ('rear', 'r'): 'rs',
+}
+# Channels a group needs before it can be converted
+_QUAD_CHANNELS = ('l', 'ls', 'r', 'rs')
+
+# pydub's AudioSegment, imported on first use and kept for later runs
+_AudioSegment = None
+
+
+def _get_audio_segment():
+    """
+    Import pydub's AudioSegment once and cache it at module level.
+    
+    The first call also pins the converter to ffmpeg's absolute path, so
+    each decode/export subprocess skips the PATH search.
+    Returns None when pydub is not installed.
+    """
+    global _AudioSegment
+    if _AudioSegment is None:
+        try:
+            from pydub import AudioSegment
+            from pydub.utils import which
+        except ImportError:
+            return None
+        ffmpeg_path = which(AudioSegment.converter)
+        if ffmpeg_path:
+            AudioSegment.converter = ffmpeg_path
+        _AudioSegment = AudioSegment
+    return _AudioSegment
+
+
+@lru_cache(maxsize=16)
+def _decode_audio(path, mtime):
+    """
+    Decode an audio file, memoized on (path, mtime).
+    
+    AudioSegments are immutable, so re-running a conversion over unchanged
+    stems reuses the decoded PCM instead of spawning ffmpeg again; a
+    changed mtime misses the cache. Decoded stems can run to several MB
+    each, so only the last few groups are kept.
+    """
+    return _get_audio_segment().from_file(path)
+
+
+def _load_audio(path):
+    """Decode an audio file through the (path, mtime) cache."""
+    return _decode_audio(path, os.path.getmtime(path))
+
+
+# NumPy sample types for the PCM widths the fast mixing path handles
+_SAMPLE_DTYPES = {2: "int16", 4: "int32"}
+
+
+def _load_pcm(segments):
+    """
+    Decode segments to equal-length mono PCM arrays sharing one format.
+    
+    The arrays are read-only views over each segment's raw data, trimmed
+    to the shortest stem by slicing, so no sample bytes are copied.
+    Returns (arrays, frame_rate, sample_width), or None when the sample
+    width is not handled.
+    """
+    frame_rate = max(seg.frame_rate for seg in segments)
+    sample_width = max(seg.sample_width for seg in segments)
+    if sample_width not in _SAMPLE_DTYPES:
+        return None
+    segments = [seg.set_channels(1).set_frame_rate(frame_rate).set_sample_width(sample_width)
+                for seg in segments]
+
+    dtype = np.dtype(_SAMPLE_DTYPES[sample_width])
+    arrays = [np.frombuffer(seg.raw_data, dtype=dtype) for seg in segments]
+    n = min(len(a) for a in arrays)
+    return [a[:n] for a in arrays], frame_rate, sample_width
+
+
+def _mix_quad_numpy(l_audio, ls_audio, r_audio, rs_audio, mix_mode, gain=1.0):
+    """
+    Mix four mono channel segments into one stereo segment using NumPy.
+    
+    Follows the mixing rule documented on convert_quad_group, so the
+    result is sample-for-sample what the pydub fallback produces.
+    Returns None when the sample width is not handled, so the caller can
+    fall back to pydub.
+    """
+    pcm = _load_pcm((l_audio, ls_audio, r_audio, rs_audio))
+    if pcm is None:
+        return None
+    (l, ls, r, rs), frame_rate, sample_width = pcm
+
+    dtype = l.dtype
+    info = np.iinfo(dtype)
+    # Accumulate in a type twice as wide, so four full-scale samples can't overflow
+    acc_dtype = np.int32 if dtype.itemsize == 2 else np.int64
+
+    # Widen inside the ufunc and clip in place, so each side is one buffer.
+    # Every addition is saturated before the next one, as overlay does, so
+    # e.g. a clipped L+LS isn't pulled back into range by a negative R
+    if mix_mode == "balance":
+        # L+LS to left channel, R+RS to right channel
+        left = np.add(l, ls, dtype=acc_dtype)
+        right = np.add(r, rs, dtype=acc_dtype)
+    else:  # downmix
+        left = np.add(l, ls, dtype=acc_dtype)
+        np.clip(left, info.min, info.max, out=left)
+        left += r
+        np.clip(left, info.min, info.max, out=left)
+        left += rs
+        right = left
+
+    np.clip(left, info.min, info.max, out=left)
+    if right is not left:
+        np.clip(right, info.min, info.max, out=right)
+
+    # Volume goes on the saturated mix the way apply_gain does it: the same
+    # dB-derived factor, then saturate and floor each sample
+    if gain != 1.0:
+        factor = 10 ** (20 * math.log10(gain) / 20)
+        shared = right is left
+        left = np.floor(np.clip(left * factor, info.min, info.max))
+        right = left if shared else np.floor(np.clip(right * factor, info.min, info.max))
+
+    # Interleave with strided writes straight into the output sample type,
+    # skipping the narrowed copies and the temporary np.stack would make
+    stereo = np.empty(2 * len(left), dtype=dtype)
+    stereo[0::2] = left
+    stereo[1::2] = right
+
+    return type(l_audio)(data=stereo.tobytes(),
+                         sample_width=sample_width, frame_rate=frame_rate, channels=2)
+
+
+def convert_quad_group(base_name, files, output_folder, mix_mode, gain,
+                       output_format, export_params, overwrite, delete_originals):
+    """
+    Convert one quad group (L, LS, R, RS) to a stereo file.
+    
+    Runs without touching Tk, so it is safe to call from worker threads.
+    gain is the linear volume factor (1.0 for none) and export_params the
+    keyword arguments for AudioSegment.export, both computed once per run.
+    
+    Mixing rule, shared by the NumPy path and the pydub fallback: stems
+    are added one at a time (L+LS, then +R, then +RS for downmix) and
+    saturated to the sample range after every addition, as pydub's
+    overlay does; the volume is applied afterwards to the saturated mix,
+    as apply_gain does (saturate, then floor).
+    
+    Returns:
+        Tuple of (status, messages) where status is "converted", "skipped"
+        or "error" and messages is a list of (logging level, text) pairs
+    """
+    AudioSegment = _get_audio_segment()
+
+    messages = [(logging.INFO, f"Processing: {base_name}")]
+    try:
+        # Determine output filename
+        output_filename = f"{base_name}_stereo.{output_format}"
+        output_path = os.path.join(output_folder, output_filename)
+
+        # Check if output exists (lexists: no need to follow symlinks)
+        if not overwrite and os.path.lexists(output_path):
+            messages.append((logging.INFO, f"  Skipped (file exists): {output_filename}"))
+            return "skipped", messages
+
+        # Load audio files (auto-detect format)
+        l_audio = _load_audio(files['l'])
+        ls_audio = _load_audio(files['ls'])
+        r_audio = _load_audio(files['r'])
+        rs_audio = _load_audio(files['rs'])
+
+        stereo_audio = None
+        if NUMPY_AVAILABLE:
+            stereo_audio = _mix_quad_numpy(l_audio, ls_audio, r_audio, rs_audio, mix_mode, gain)
+
+        if stereo_audio is None:
+            # Ensure all files have the same length; stems exported together
+            # usually already match, so only slice (and copy) when they don't
+            lengths = (len(l_audio), len(ls_audio), len(r_audio), len(rs_audio))
+            min_length = min(lengths)
+            if max(lengths) != min_length:
+                l_audio = l_audio[:min_length]
+                ls_audio = ls_audio[:min_length]
+                r_audio = r_audio[:min_length]
+                rs_audio = rs_audio[:min_length]
+
+            # Mix channels based on mode
+            if mix_mode == "balance":
+                # L+LS to left channel, R+RS to right channel
+                left_channel = l_audio.overlay(ls_audio)
+                right_channel = r_audio.overlay(rs_audio)
+            else:  # downmix
+                # Mix all channels to stereo
+                mono_mix = l_audio.overlay(ls_audio).overlay(r_audio).overlay(rs_audio)
+                left_channel = mono_mix
+                right_channel = mono_mix
+
+            # Create stereo audio
+            stereo_audio = AudioSegment.from_mono_audiosegments(left_channel, right_channel)
+
+            # Apply volume adjustment once to the stereo mix rather than per channel
+            if gain != 1.0:
+                stereo_audio = stereo_audio.apply_gain(20 * math.log10(gain))
+
+        stereo_audio.export(output_path, format=output_format, **export_params)
+
+        messages.append((logging.INFO, f"  Converted: {output_filename}"))
+
+        # Delete originals if requested; only reached once the export succeeded
+        if delete_originals:
+            unlink = os.unlink
+            for channel in _QUAD_CHANNELS:
+                channel_file = files[channel]
+                try:
+                    unlink(channel_file)
+                    messages.append((logging.INFO, f"  Deleted: {os.path.basename(channel_file)}"))
+                except OSError as e:
+                    messages.append((logging.WARNING, f"  Failed to delete {channel_file}: {e}"))
+
+        return "converted", messages
+
+    except Exception as e:
+        messages.append((logging.ERROR, f"  Error processing {base_name}: {e}"))
+        return "error", messages
+
+
 @register_tool
 class QuadToStereoTool(BaseTool):
     @property
@@ -35,22 +279,44 @@ class QuadToStereoTool(BaseTool):
         return QuadToStereoTab(parent, self.config)
 
 class TextHandler(logging.Handler):
-    """Logging handler for Tkinter Text widget."""
+    """
+    Logging handler for Tkinter Text widget.
+    
+    Lines are buffered and written in one insert every FLUSH_MS, so a
+    long batch costs one widget reconfigure and redraw per flush rather
+    than per message.
+    """
+    FLUSH_MS = 100
+
     def __init__(self, text_widget):
         super().__init__()
         self.text_widget = text_widget
+        self.pending = deque()
+        self._flush_id = None
 
     def emit(self, record):
-        msg = self.format(record)
+        self.pending.append(self.format(record) + '\n')
+        if self._flush_id is None:
+            self._flush_id = self.text_widget.after(self.FLUSH_MS, self._flush)
+
+    def _flush(self):
+        self._flush_id = None
+        if not self.pending:
+            return
+        text = ''.join(self.pending)
+        self.pending.clear()
         self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, msg + '\n')
+        self.text_widget.insert(tk.END, text)
         self.text_widget.configure(state='disabled')
         self.text_widget.see(tk.END)
 
+
 class QuadToStereoTab(ttk.Frame):
     def __init__(self, parent, config):
         super().__init__(parent)
         self.config = config
+        # Worker thread results, drained on the Tk thread
+        self._result_queue = queue.Queue()
         self.setup_ui()
         self.setup_logging()
 
@@ -166,8 +432,9 @@ class QuadToStereoTab(ttk.Frame):
 
         ttk.Button(button_frame, text="Scan for Quad Groups",
                 command=self.scan_quad_groups).pack(side="left")
-        ttk.Button(button_frame, text="Convert to Stereo",
-                command=self.convert_to_stereo).pack(side="left", padx=(10, 0))
+        self.convert_button = ttk.Button(button_frame, text="Convert to Stereo",
+                                         command=self.convert_to_stereo)
+        self.convert_button.pack(side="left", padx=(10, 0))
         ttk.Button(button_frame, text="Clear Log",
                 command=self.clear_log).pack(side="right")
 
@@ -221,11 +488,6 @@ class QuadToStereoTab(ttk.Frame):
 
     def find_quad_groups(self, root_path, log_incomplete=False):
         """Find all quad audio groups under root path."""
-        # Pattern 1: basename_l.mp3, basename_ls.mp3, basename_r.mp3, basename_rs.mp3
-        pattern1 = re.compile(r'(.+?)_(l|ls|r|rs)\.(mp3|wav)$', re.IGNORECASE)
-        # Pattern 2: basename_front_l.wav, basename_front_r.wav, basename_rear_l.wav, basename_rear_r.wav
-        pattern2 = re.compile(r'(.+?)_(front|rear)_(l|r)\.(mp3|wav)$', re.IGNORECASE)
-        
         groups = {}
         matched_files = []
         unmatched_files = []
@@ -233,71 +495,41 @@ class QuadToStereoTab(ttk.Frame):
         if not os.path.exists(root_path):
             return groups, {}
 
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                # Skip non-audio files
-                if not file.lower().endswith(('.mp3', '.wav', '.ogg')):
-                    continue
-                # Skip non-audio files
-                if not file.lower().endswith(('.mp3', '.wav', '.ogg')):
-                    continue
-                
-                matched = False
-                
-                # Try pattern 1 first (L, LS, R, RS)
-                match = pattern1.match(file)
-                if match:
-                    base_name = match.group(1)
-                    channel = match.group(2).lower()
-                    file_path = os.path.join(root, file)
-
-                    if base_name not in groups:
-                        groups[base_name] = {'root': root, 'pattern': 1}
-
-                    groups[base_name][channel] = file_path
-                    matched_files.append((file, f"Pattern 1: {base_name} - {channel}"))
-                    matched = True
-                    continue
-                
-                # Try pattern 2 (front_l, front_r, rear_l, rear_r)
-                match = pattern2.match(file)
-                if match:
-                    base_name = match.group(1)
-                    position = match.group(2).lower()  # front or rear
-                    side = match.group(3).lower()  # l or r
-                    file_path = os.path.join(root, file)
-
-                    if base_name not in groups:
-                        groups[base_name] = {'root': root, 'pattern': 2}
-
-                    # Map front_l -> l, front_r -> r, rear_l -> ls, rear_r -> rs
-                    if position == 'front' and side == 'l':
-                        groups[base_name]['l'] = file_path
-                        channel_mapped = 'l'
-                    elif position == 'front' and side == 'r':
-                        groups[base_name]['r'] = file_path
-                        channel_mapped = 'r'
-                    elif position == 'rear' and side == 'l':
-                        groups[base_name]['ls'] = file_path
-                        channel_mapped = 'ls'
-                    elif position == 'rear' and side == 'r':
-                        groups[base_name]['rs'] = file_path
-                        channel_mapped = 'rs'
-                    
-                    matched_files.append((file, f"Pattern 2: {base_name} - {position}_{side} -> {channel_mapped}"))
-                    matched = True
-                
-                if not matched:
-                    unmatched_files.append(file)
-
-                if not matched:
-                    unmatched_files.append(file)
+        # Only audio files are yielded, so non-audio entries never reach the regexes
+        for entry in iter_files(root_path, ('.mp3', '.wav', '.ogg')):
+            file = entry.name
+            root = os.path.dirname(entry.path)
+            file_path = entry.path
+            
+            # Try pattern 1 first (L, LS, R, RS)
+            match = _QUAD_RE.match(file)
+            if match:
+                base_name = match.group(1)
+                channel = match.group(2).lower()
+
+                groups.setdefault(base_name, {'root': root, 'pattern': 1})[channel] = file_path
+                matched_files.append((file, f"Pattern 1: {base_name} - {channel}"))
+                continue
+            
+            # Try pattern 2 (front_l, front_r, rear_l, rear_r)
+            match = _QUAD_POSITION_RE.match(file)
+            if match:
+                base_name = match.group(1)
+                position = match.group(2).lower()  # front or rear
+                side = match.group(3).lower()  # l or r
+
+                channel_mapped = _POSITION_CHANNELS[position, side]
+                groups.setdefault(base_name, {'root': root, 'pattern': 2})[channel_mapped] = file_path
+                matched_files.append((file, f"Pattern 2: {base_name} - {position}_{side} -> {channel_mapped}"))
+                continue
+
+            unmatched_files.append(file)
 
         # Filter complete groups (must have all 4 channels)
         complete_groups = {}
         incomplete_groups = {}
         for base_name, files in groups.items():
-            if all(ch in files for ch in ['l', 'ls', 'r', 'rs']):
+            if 'l' in files and 'ls' in files and 'r' in files and 'rs' in files:
                 complete_groups[base_name] = files
             elif log_incomplete:
                 incomplete_groups[base_name] = files
@@ -315,6 +547,8 @@ class QuadToStereoTab(ttk.Frame):
             return
 
         self.logger.info(f"Scanning for quad audio groups in: {input_folder}")
+        if _get_audio_segment() is None:
+            self.logger.warning("pydub is not installed; groups can be scanned but not converted.")
 
         result = self.find_quad_groups(input_folder, log_incomplete=True)
         groups, incomplete_groups, matched_files, unmatched_files = result
@@ -345,8 +579,8 @@ class QuadToStereoTab(ttk.Frame):
         if incomplete_groups:
             self.logger.warning(f"Found {len(incomplete_groups)} incomplete quad groups:")
             for base_name, files in incomplete_groups.items():
-                missing = [ch for ch in ['l', 'ls', 'r', 'rs'] if ch not in files]
-                present = [ch for ch in ['l', 'ls', 'r', 'rs'] if ch in files]
+                missing = [ch for ch in _QUAD_CHANNELS if ch not in files]
+                present = [ch for ch in _QUAD_CHANNELS if ch in files]
                 self.logger.warning(f"  {base_name}: has {present}, missing {missing}")
                 for channel in present:
                     self.logger.info(f"    {channel.upper()}: {os.path.basename(files[channel])}")
@@ -358,11 +592,15 @@ class QuadToStereoTab(ttk.Frame):
 
         self.logger.info(f"Found {len(groups)} complete quad audio groups:")
 
+        # Scanned paths are built by joining onto input_folder, so stripping
+        # that prefix gives the relative path without os.path.relpath's work
+        prefix = os.path.join(input_folder, "")
         for base_name, files in groups.items():
             self.logger.info(f"  {base_name}:")
-            for channel in ['l', 'ls', 'r', 'rs']:
+            for channel in _QUAD_CHANNELS:
                 if channel in files:
-                    rel_path = os.path.relpath(files[channel], input_folder)
+                    path = files[channel]
+                    rel_path = path[len(prefix):] if path.startswith(prefix) else path
                     self.logger.info(f"    {channel.upper()}: {rel_path}")
 
         self.status_label.config(text=f"Found {len(groups)} quad groups", foreground="green")
@@ -381,9 +619,7 @@ class QuadToStereoTab(ttk.Frame):
             return
 
         # Check if pydub is available
-        try:
-            from pydub import AudioSegment
-        except ImportError:
+        if _get_audio_segment() is None:
             messagebox.showerror("Error", "pydub library is required for audio processing.\n"
                                 "Please install it with: pip install pydub")
             return
@@ -404,92 +640,63 @@ class QuadToStereoTab(ttk.Frame):
         os.makedirs(output_folder, exist_ok=True)
 
         mix_mode = self.mix_mode.get()
-        volume_adjustment = self.volume_adjustment.get()
+        # The Scale rarely lands exactly on 1.0, so round before deciding on gain
+        volume_adjustment = round(self.volume_adjustment.get(), 2)
         output_format = self.output_format.get()
         quality = self.quality.get()
         overwrite = self.overwrite_var.get()
         delete_originals = self.delete_originals_var.get()
 
-        converted = 0
-        skipped = 0
-        errors = 0
-
         self.logger.info(f"Starting conversion of {len(groups)} quad groups...")
         self.logger.info(f"Mix mode: {mix_mode}")
         self.logger.info(f"Volume adjustment: {volume_adjustment}x")
         self.logger.info(f"Output format: {output_format} ({quality})")
 
-        for base_name, files in groups.items():
+        # Convert off the Tk thread so the UI stays responsive
+        self.convert_button.config(state="disabled")
+        self.status_label.config(text=f"Converting {len(groups)} quad groups...", foreground="blue")
+        # Volume is constant for the run; treat near-unity as no gain at all
+        gain = volume_adjustment if abs(volume_adjustment - 1.0) > 1e-3 else 1.0
+        # Export settings are the same for every group
+        export_params = {"bitrate": quality} if output_format in ("mp3", "ogg") else {}
+        args = (output_folder, mix_mode, gain, output_format, export_params, overwrite, delete_originals)
+        threading.Thread(target=self._run_conversion, args=(groups, args), daemon=True).start()
+        self.after(50, self._drain_result_queue)
+
+    def _run_conversion(self, groups, args):
+        """Worker thread: convert all groups and queue their log lines and final counts."""
+        counts = {"converted": 0, "skipped": 0, "error": 0}
+        # Groups are independent: decode/encode runs in ffmpeg subprocesses and
+        # the NumPy mix releases the GIL, so a thread pool overlaps them well
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(convert_quad_group, base_name, files, *args)
+                       for base_name, files in groups.items()]
+            # Report groups as they finish so the log streams progress instead
+            # of waiting behind a slow group; each group's lines stay together
+            for future in as_completed(futures):
+                status, messages = future.result()
+                self._result_queue.put(("log", messages))
+                counts[status] += 1
+        self._result_queue.put(("done", counts))
+
+    def _drain_result_queue(self):
+        """Tk thread: log queued worker output and finish up once the worker is done."""
+        while True:
             try:
-                self.logger.info(f"Processing: {base_name}")
-
-                # Determine output filename
-                output_filename = f"{base_name}_stereo.{output_format}"
-                output_filename = f"{base_name}_stereo.{output_format}"
-                output_path = os.path.join(output_folder, output_filename)
-
-                # Check if output exists
-                if os.path.exists(output_path) and not overwrite:
-                    self.logger.info(f"  Skipped (file exists): {output_filename}")
-                    skipped += 1
-                    continue
-
-                # Load audio files (auto-detect format)
-                l_audio = AudioSegment.from_file(files['l'])
-                ls_audio = AudioSegment.from_file(files['ls'])
-                r_audio = AudioSegment.from_file(files['r'])
-                rs_audio = AudioSegment.from_file(files['rs'])
-
-                # Ensure all files have the same length
-                min_length = min(len(l_audio), len(ls_audio), len(r_audio), len(rs_audio))
-                l_audio = l_audio[:min_length]
-                ls_audio = ls_audio[:min_length]
-                r_audio = r_audio[:min_length]
-                rs_audio = rs_audio[:min_length]
-
-                # Mix channels based on mode
-                if mix_mode == "balance":
-                    # L+LS to left channel, R+RS to right channel
-                    left_channel = l_audio.overlay(ls_audio)
-                    right_channel = r_audio.overlay(rs_audio)
-                else:  # downmix
-                    # Mix all channels to stereo
-                    mono_mix = l_audio.overlay(ls_audio).overlay(r_audio).overlay(rs_audio)
-                    left_channel = mono_mix
-                    right_channel = mono_mix
-
-                # Apply volume adjustment
-                if volume_adjustment != 1.0:
-                    left_channel = left_channel + (20 * math.log10(volume_adjustment))
-                    right_channel = right_channel + (20 * math.log10(volume_adjustment))
-
-                # Create stereo audio
-                stereo_audio = AudioSegment.from_mono_audiosegments(left_channel, right_channel)
-
-                # Export based on format
-                export_params = {}
-                if output_format == "mp3":
-                    export_params["bitrate"] = quality
-                elif output_format == "ogg":
-                    export_params["bitrate"] = quality
-
-                stereo_audio.export(output_path, format=output_format, **export_params)
-
-                self.logger.info(f"  Converted: {output_filename}")
-                converted += 1
-
-                # Delete originals if requested
-                if delete_originals:
-                    for channel_file in [files['l'], files['ls'], files['r'], files['rs']]:
-                        try:
-                            os.remove(channel_file)
-                            self.logger.info(f"  Deleted: {os.path.basename(channel_file)}")
-                        except Exception as e:
-                            self.logger.warning(f"  Failed to delete {channel_file}: {e}")
-
-            except Exception as e:
-                self.logger.error(f"  Error processing {base_name}: {e}")
-                errors += 1
+                kind, payload = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                for level, message in payload:
+                    self.logger.log(level, message)
+            else:
+                self._finish_conversion(payload["converted"], payload["skipped"], payload["error"])
+                return
+        self.after(50, self._drain_result_queue)
+
+    def _finish_conversion(self, converted, skipped, errors):
+        """Report the conversion summary and re-enable the Convert button."""
+        self.convert_button.config(state="normal")
 
         # Summary
         self.logger.info(f"Conversion complete!")
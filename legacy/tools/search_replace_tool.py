@@ -3,11 +3,164 @@ Search and Replace Tool - Batch search and replace in filenames and file content
 """
 
 import os
+import re
+import mmap
+import shutil
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 from .base_tool import BaseTool, register_tool
-from .utils import PlaceholderEntry, browse_folder, browse_folder_with_context
+from .utils import PlaceholderEntry, browse_folder, browse_folder_with_context, iter_files
+
+# Common VMT texture parameters, compiled once for the smart-mode filter
+_VMT_TEXTURE_PARAM_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$basetexture\s+["\']?([^"\'\s\}]+)',
+    r'\$bumpmap\s+["\']?([^"\'\s\}]+)',
+    r'\$normalmap\s+["\']?([^"\'\s\}]+)',
+    r'\$envmapmask\s+["\']?([^"\'\s\}]+)',
+    r'\$detail\s+["\']?([^"\'\s\}]+)',
+    r'\$phongexponenttexture\s+["\']?([^"\'\s\}]+)',
+    r'\$lightwarptexture\s+["\']?([^"\'\s\}]+)',
+    r'\$texture2\s+["\']?([^"\'\s\}]+)',
+    r'\$iris\s+["\']?([^"\'\s\}]+)',
+    r'\$corneatexture\s+["\']?([^"\'\s\}]+)',
+))
+
+# Worker threads for per-file search/replace; the work is I/O bound, so
+# oversubscribe the cores to keep reads in flight
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files between progress updates sent from the worker
+_PROGRESS_INTERVAL = 100
+
+# Largest block of result text inserted into the Text widget per drain tick
+_RESULTS_CHUNK_SIZE = 64 * 1024
+
+# A NUL byte in this many leading bytes marks a file as binary
+_BINARY_SNIFF_SIZE = 8192
+
+
+@lru_cache(maxsize=256)
+def _compile_search(search_text, case_sensitive, whole_words):
+    """
+    Compile the search pattern once for a whole preview/apply run.
+    
+    Cached, so repeating a preview and then an apply with the same
+    options reuses the pattern without touching re's own cache.
+    
+    Returns None for a plain case-sensitive search, where str methods
+    beat the regex engine and the callers use them directly.
+    """
+    if case_sensitive and not whole_words:
+        return None
+    body = re.escape(search_text)
+    if whole_words:
+        body = r'\b' + body + r'\b'
+    return re.compile(body, 0 if case_sensitive else re.IGNORECASE)
+
+
+def _is_word_byte(b):
+    """True for a one-byte slice that \\w matches (ASCII letters, digits, underscore)."""
+    return b.isalnum() or b == b'_'
+
+
+def _contains_whole_word(raw, needle):
+    """
+    Bytes-level stand-in for a \\b...\\b search of an ASCII word needle.
+    
+    Only valid when needle starts and ends with a word character; a hit
+    is any occurrence with no ASCII word byte directly either side.
+    """
+    size = len(needle)
+    pos = raw.find(needle)
+    while pos != -1:
+        if not _is_word_byte(raw[pos - 1:pos] if pos else b'') and \
+                not _is_word_byte(raw[pos + size:pos + size + 1]):
+            return True
+        pos = raw.find(needle, pos + 1)
+    return False
+
+
+def _read_bytes(path):
+    """
+    Read a whole file as bytes without a buffered reader.
+    
+    Unbuffered FileIO.readall sizes its result from fstat and fills it in
+    one read for regular files, so the many small VMT/QC files in a mod
+    skip BufferedReader's extra buffer and copy.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        return f.readall()
+
+
+def _may_contain(raw, search_text, pattern):
+    """
+    Cheap bytes-level check run before a file is decoded.
+    
+    Returns False for binary files and for files that cannot contain the
+    search text, so most misses skip decoding and the regex engine.
+    """
+    if b'\x00' in raw[:_BINARY_SNIFF_SIZE]:
+        return False
+    needle = search_text.encode('utf-8')
+    if pattern is None:
+        return needle in raw
+
+    ignore_case = pattern.flags & re.IGNORECASE
+    if ignore_case:
+        if not search_text.isascii():
+            return True
+        # bytes.lower only folds ASCII, which is enough for an ASCII needle
+        needle = needle.lower()
+        raw = raw.lower()
+
+    # Whole-word patterns from _compile_search start with \b; for an ASCII
+    # needle bounded by word characters, check the boundaries at each find()
+    # hit instead of settling for a plain substring test
+    if (pattern.pattern.startswith(r'\b') and search_text.isascii()
+            and _is_word_byte(needle[:1]) and _is_word_byte(needle[-1:])):
+        return _contains_whole_word(raw, needle)
+    return needle in raw
+
+
+def _relative_to(path, prefix):
+    """
+    Strip the scanned folder's prefix from a path for display.
+    
+    Target paths are built by joining onto the folder, so a slice gives
+    the same result as os.path.relpath without normalizing every path.
+    """
+    return path[len(prefix):] if path.startswith(prefix) else path
+
+
+def _make_replacer(search_text, replace_text, case_sensitive, whole_words):
+    """
+    Build the replace function for one preview/apply run.
+    
+    The returned callable maps text to (new_text, replacement_count); the
+    option checks happen here once instead of on every file.
+    """
+    pattern = _compile_search(search_text, case_sensitive, whole_words)
+    if pattern is None:
+        def replace_plain(text):
+            # Count first: most names and files miss, and then no copy is made
+            count = text.count(search_text)
+            if not count:
+                return text, 0
+            return text.replace(search_text, replace_text), count
+        return replace_plain
+
+    # Escape backslashes so subn inserts replace_text literally
+    repl = replace_text.replace('\\', '\\\\')
+
+    def replace_pattern(text):
+        return pattern.subn(repl, text)
+    return replace_pattern
+
 
 @register_tool
 class SearchReplaceTool(BaseTool):
@@ -30,6 +183,9 @@ class SearchReplaceTab(ttk.Frame):
     def __init__(self, parent, config):
         super().__init__(parent)
         self.config = config
+        # Preview/apply run on a worker thread; results come back through this queue
+        self._queue = queue.Queue()
+        self._cancel_event = threading.Event()
         self.setup_ui()
 
     def setup_ui(self):
@@ -124,10 +280,19 @@ class SearchReplaceTab(ttk.Frame):
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill="x", pady=(0, 10))
 
-        ttk.Button(button_frame, text="Preview Changes",
-                    command=self.preview_changes).pack(side="left")
-        ttk.Button(button_frame, text="Apply Changes",
-                    command=self.apply_changes).pack(side="left", padx=(10, 0))
+        self.preview_button = ttk.Button(button_frame, text="Preview Changes",
+                                         command=self.preview_changes)
+        self.preview_button.pack(side="left")
+        self.apply_button = ttk.Button(button_frame, text="Apply Changes",
+                                       command=self.apply_changes)
+        self.apply_button.pack(side="left", padx=(10, 0))
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", state="disabled",
+                                        command=self.cancel_operation)
+        self.cancel_button.pack(side="left", padx=(10, 0))
+
+        # Progress of the running preview/apply
+        self.progress = ttk.Progressbar(main_frame, mode="determinate")
+        self.progress.pack(fill="x", pady=(0, 10))
 
         # Results section
         results_frame = ttk.LabelFrame(main_frame, text="Results", padding=10)
@@ -161,32 +326,23 @@ class SearchReplaceTab(ttk.Frame):
 
         return extensions
 
-    def find_target_files(self, folder_path):
-        """Find files that match the specified extensions."""
-        target_files = []
-        extensions = self.get_file_extensions()
-
+    def find_target_files(self, folder_path, extensions, vmt_smart_mode):
+        """
+        Find files that match the specified extensions.
+        
+        Takes the extension list and VMT smart mode flag as arguments rather
+        than reading the Tk variables, so it can run on a worker thread.
+        """
         if not os.path.exists(folder_path):
-            return target_files
-
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-
-                # Check if file matches any extension filter
-                if not extensions:  # If no filter, include all files
-                    target_files.append(file_path)
-                else:
-                    file_lower = file.lower()
-                    for ext in extensions:
-                        # Remove the "*." prefix and check if file ends with the extension
-                        ext_suffix = ext[2:] if ext.startswith('*.') else ext
-                        if file_lower.endswith('.' + ext_suffix):
-                            target_files.append(file_path)
-                            break
+            return []
+
+        # get_file_extensions returns lowercase "*.ext" patterns; strip the "*"
+        # so a single endswith(tuple) call tests them all (None = no filter)
+        suffixes = tuple(ext[1:] for ext in extensions) or None
+        target_files = [entry.path for entry in iter_files(folder_path, suffixes)]
 
         # Apply VMT smart filtering if enabled
-        if self.vmt_smart_mode_var.get():
+        if vmt_smart_mode:
             target_files = self.filter_files_by_vmt_references(target_files, folder_path)
 
         return target_files
@@ -199,23 +355,8 @@ class SearchReplaceTab(ttk.Frame):
             with open(vmt_file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read().lower()
                 
-                # Common VMT texture parameters
-                texture_params = [
-                    r'\$basetexture\s+["\']?([^"\'\s\}]+)',
-                    r'\$bumpmap\s+["\']?([^"\'\s\}]+)',
-                    r'\$normalmap\s+["\']?([^"\'\s\}]+)',
-                    r'\$envmapmask\s+["\']?([^"\'\s\}]+)',
-                    r'\$detail\s+["\']?([^"\'\s\}]+)',
-                    r'\$phongexponenttexture\s+["\']?([^"\'\s\}]+)',
-                    r'\$lightwarptexture\s+["\']?([^"\'\s\}]+)',
-                    r'\$texture2\s+["\']?([^"\'\s\}]+)',
-                    r'\$iris\s+["\']?([^"\'\s\}]+)',
-                    r'\$corneatexture\s+["\']?([^"\'\s\}]+)',
-                ]
-                
-                import re
-                for param_pattern in texture_params:
-                    matches = re.findall(param_pattern, content, re.IGNORECASE)
+                for param_re in _VMT_TEXTURE_PARAM_RES:
+                    matches = param_re.findall(content)
                     for match in matches:
                         # Clean up the texture path
                         texture_path = match.strip().strip('"\'')
@@ -227,145 +368,168 @@ class SearchReplaceTab(ttk.Frame):
             
         return texture_refs
 
-    def is_texture_referenced_in_vmts(self, texture_name, folder_path):
-        """Check if a texture is actually referenced in any VMT files."""
-        # Find all VMT files in the folder
-        vmt_files = []
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                if file.lower().endswith('.vmt'):
-                    vmt_files.append(os.path.join(root, file))
+    def collect_vmt_reference_names(self, folder_path):
+        """Return the lowercase texture filenames referenced by every VMT under folder_path."""
+        ref_filenames = set()
+        for entry in iter_files(folder_path, ('.vmt',)):
+            for ref in self.get_vmt_texture_references(entry.path):
+                # Extract just the filename from the texture reference
+                ref_filenames.add(os.path.basename(ref).lower())
+        return ref_filenames
+
+    def is_texture_referenced_in_vmts(self, texture_name, folder_path, ref_filenames=None):
+        """
+        Check if a texture is actually referenced in any VMT files.
         
-        # Check each VMT file for references to this texture
+        Pass ref_filenames from collect_vmt_reference_names when checking
+        many textures, so the VMTs are walked and parsed only once.
+        """
+        if ref_filenames is None:
+            ref_filenames = self.collect_vmt_reference_names(folder_path)
+
         texture_name_lower = texture_name.lower()
-        for vmt_file in vmt_files:
-            texture_refs = self.get_vmt_texture_references(vmt_file)
-            for ref in texture_refs:
-                # Extract just the filename from the texture reference
-                ref_filename = os.path.basename(ref).lower()
-                if texture_name_lower in ref_filename or ref_filename in texture_name_lower:
-                    return True
-                    
+        for ref_filename in ref_filenames:
+            if texture_name_lower in ref_filename or ref_filename in texture_name_lower:
+                return True
+
         return False
 
     def filter_files_by_vmt_references(self, target_files, folder_path):
         """Filter files to only include those referenced in VMT files."""
         filtered_files = []
-        
+        ref_filenames = None
+
         for file_path in target_files:
-            filename = os.path.basename(file_path)
-            
+            filename_lower = os.path.basename(file_path).lower()
+
             # Always include VMT files themselves
-            if filename.lower().endswith('.vmt'):
+            if filename_lower.endswith('.vmt'):
                 filtered_files.append(file_path)
             else:
-                # For other files, check if they're referenced in VMTs
-                base_name = os.path.splitext(filename)[0]
-                if self.is_texture_referenced_in_vmts(base_name, folder_path):
+                # For other files, check if they're referenced in VMTs; the
+                # references are gathered on first use and shared by all files
+                if ref_filenames is None:
+                    ref_filenames = self.collect_vmt_reference_names(folder_path)
+                base_name = os.path.splitext(filename_lower)[0]
+                if self.is_texture_referenced_in_vmts(base_name, folder_path, ref_filenames):
                     filtered_files.append(file_path)
-                    
+
         return filtered_files
 
-    def search_in_filename(self, filename, search_text, case_sensitive, whole_words):
+    def search_in_filename(self, filename, search_text, pattern):
         """Check if search text is found in filename."""
-        search_target = filename if case_sensitive else filename.lower()
-        search_term = search_text if case_sensitive else search_text.lower()
+        if pattern is None:
+            return search_text in filename
+        return pattern.search(filename) is not None
 
-        if whole_words:
-            import re
-            pattern = r'\b' + re.escape(search_term) + r'\b'
-            return bool(re.search(pattern, search_target, 0 if case_sensitive else re.IGNORECASE))
-        else:
-            return search_term in search_target
-
-    def search_in_file_content(self, file_path, search_text, case_sensitive, whole_words):
+    def search_in_file_content(self, file_path, search_text, pattern):
         """Search for text in file content and return line numbers where found."""
         matches = []
 
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    search_target = line if case_sensitive else line.lower()
-                    search_term = search_text if case_sensitive else search_text.lower()
-
-                    if whole_words:
-                        import re
-                        pattern = r'\b' + re.escape(search_term) + r'\b'
-                        if re.search(pattern, search_target, 0 if case_sensitive else re.IGNORECASE):
-                            matches.append(line_num)
-                    else:
-                        if search_term in search_target:
-                            matches.append(line_num)
+            if pattern is None:
+                return self._find_lines_mmap(file_path, search_text.encode('utf-8'))
+
+            raw = _read_bytes(file_path)
+            if not _may_contain(raw, search_text, pattern):
+                return matches
+
+            # One finditer sweep over the whole text; line numbers come from
+            # counting newlines between consecutive hits
+            text = raw.decode('utf-8', 'ignore').replace('\r\n', '\n')
+            line_num = 1
+            scanned = 0
+            for match in pattern.finditer(text):
+                start = match.start()
+                line_num += text.count('\n', scanned, start)
+                scanned = start
+                if not matches or matches[-1] != line_num:
+                    matches.append(line_num)
 
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
 
         return matches
 
-    def replace_in_filename(self, file_path, search_text, replace_text, case_sensitive, whole_words):
+    def _find_lines_mmap(self, file_path, needle):
+        """
+        Return line numbers containing needle, searching the raw bytes.
+        
+        For plain case-sensitive searches the file is memory-mapped and
+        scanned with mmap.find, so nothing is decoded or split into lines;
+        newlines are only counted up to each hit.
+        """
+        matches = []
+        with open(file_path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return matches
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if b'\x00' in mm[:_BINARY_SNIFF_SIZE]:
+                    return matches
+                line_num = 1
+                scanned = 0
+                pos = mm.find(needle)
+                while pos != -1:
+                    line_num += mm[scanned:pos].count(b'\n')
+                    matches.append(line_num)
+                    # One entry per line: resume after the end of this line
+                    eol = mm.find(b'\n', pos)
+                    if eol == -1:
+                        break
+                    line_num += 1
+                    scanned = eol + 1
+                    pos = mm.find(needle, scanned)
+        return matches
+
+    def replace_in_filename(self, file_path, replacer):
         """Replace text in filename and return new path."""
         directory = os.path.dirname(file_path)
         filename = os.path.basename(file_path)
 
-        if whole_words:
-            import re
-            pattern = r'\b' + re.escape(search_text) + r'\b'
-            new_filename = re.sub(pattern, replace_text, filename,
-                                flags=0 if case_sensitive else re.IGNORECASE)
-        else:
-            if case_sensitive:
-                new_filename = filename.replace(search_text, replace_text)
-            else:
-                # Case-insensitive replacement
-                import re
-                new_filename = re.sub(re.escape(search_text), replace_text, filename, flags=re.IGNORECASE)
+        new_filename = replacer(filename)[0]
 
         if new_filename != filename:
             return os.path.join(directory, new_filename)
         else:
             return None  # No change
 
-    def replace_in_file_content(self, file_path, search_text, replace_text, case_sensitive, whole_words, create_backup):
-        """Replace text in file content."""
+    def replace_in_file_content(self, file_path, search_text, pattern, replacer, create_backup):
+        """
+        Replace text in file content and return the number of replacements.
+        
+        search_text and pattern drive the bytes preflight; replacer comes
+        from _make_replacer and does the substitution and count in one call.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            raw = _read_bytes(file_path)
+            # Binary files and files without the search text are left alone
+            if not _may_contain(raw, search_text, pattern):
+                return 0
 
-            original_content = content
+            content = raw.decode('utf-8', 'ignore').replace('\r\n', '\n')
+            new_content, count = replacer(content)
 
-            if whole_words:
-                import re
-                pattern = r'\b' + re.escape(search_text) + r'\b'
-                new_content = re.sub(pattern, replace_text, content,
-                                    flags=0 if case_sensitive else re.IGNORECASE)
-            else:
-                if case_sensitive:
-                    new_content = content.replace(search_text, replace_text)
-                else:
-                    import re
-                    new_content = re.sub(re.escape(search_text), replace_text, content, flags=re.IGNORECASE)
-
-            if new_content != original_content:
-                # Create backup if requested
+            if new_content != content:
+                # Create backup if requested; a file-level copy keeps the exact
+                # original bytes (and mtime) instead of re-encoding decoded text
                 if create_backup:
-                    backup_path = file_path + '.backup'
-                    with open(backup_path, 'w', encoding='utf-8') as f:
-                        f.write(original_content)
-
-                # Write modified content
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-
-                # Count replacements
-                if whole_words:
-                    import re
-                    pattern = r'\b' + re.escape(search_text) + r'\b'
-                    count = len(re.findall(pattern, original_content, flags=0 if case_sensitive else re.IGNORECASE))
-                else:
-                    if case_sensitive:
-                        count = original_content.count(search_text)
-                    else:
-                        count = original_content.lower().count(search_text.lower())
+                    shutil.copy2(file_path, file_path + '.backup')
+
+                # Write modified content to a temp file and swap it in, so a
+                # crash mid-write never leaves a truncated file behind
+                tmp_path = file_path + '.tmp'
+                try:
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(new_content)
+                    shutil.copymode(file_path, tmp_path)
+                    os.replace(tmp_path, file_path)
+                except BaseException:
+                    # Don't leave a half-written temp file next to the original
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
 
                 return count
 
@@ -374,115 +538,240 @@ class SearchReplaceTab(ttk.Frame):
         except Exception as e:
             raise Exception(f"Error processing {file_path}: {e}")
 
-    def preview_changes(self):
-        """Preview what changes would be made."""
+    def _read_options(self):
+        """
+        Read and validate the form on the Tk thread.
+        
+        Returns a dict of options for the worker, or None after showing an error.
+        """
         folder_path = self.folder_path.get()
         search_text = self.search_text.get()
-        replace_text = self.replace_text.get()
 
         if not folder_path:
             messagebox.showerror("Error", "Please select a folder first.")
-            return
+            return None
 
         if not search_text:
             messagebox.showerror("Error", "Please enter text to search for.")
-            return
+            return None
 
-        case_sensitive = self.case_sensitive_var.get()
-        whole_words = self.whole_words_var.get()
         rename_files = self.rename_files_var.get()
         modify_contents = self.modify_contents_var.get()
 
         if not rename_files and not modify_contents:
             messagebox.showerror("Error", "Please select at least one option (filenames or contents).")
+            return None
+
+        replace_text = self.replace_text.get()
+        case_sensitive = self.case_sensitive_var.get()
+        whole_words = self.whole_words_var.get()
+
+        return {
+            "folder_path": folder_path,
+            "search_text": search_text,
+            "replace_text": replace_text,
+            "pattern": _compile_search(search_text, case_sensitive, whole_words),
+            "replacer": _make_replacer(search_text, replace_text, case_sensitive, whole_words),
+            "rename_files": rename_files,
+            "modify_contents": modify_contents,
+            "create_backup": self.create_backup_var.get(),
+            "extensions": self.get_file_extensions(),
+            "vmt_smart_mode": self.vmt_smart_mode_var.get(),
+        }
+
+    def _start_worker(self, target, options):
+        """Run target(options) on a worker thread, with the buttons locked until it finishes."""
+        # Results are append-only: no undo stack, read-only between inserts
+        self.results_text.configure(state="normal", undo=False)
+        self.results_text.delete("1.0", "end")
+        self.results_text.edit_reset()
+        self.results_text.configure(state="disabled")
+        self.preview_button.config(state="disabled")
+        self.apply_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.status_label.config(text="Scanning folder...", foreground="blue")
+        self.progress.config(value=0, maximum=1)
+        self._cancel_event.clear()
+        threading.Thread(target=self._run_worker, args=(target, options), daemon=True).start()
+        self.after(50, self._drain_queue)
+
+    def _run_worker(self, target, options):
+        """Worker thread body: report unexpected failures instead of dying silently."""
+        try:
+            target(options)
+        except Exception as e:
+            self._queue.put(("done", self._finish_failed, (e,)))
+
+    def _drain_queue(self):
+        """Tk thread: append queued result text and run the finish step once the worker is done."""
+        text_parts = []
+        text_size = 0
+        progress = None
+        finish = None
+        # Cap each tick at one ~64 KB insert so a burst of results never
+        # stalls the event loop; leftovers are picked up on the next tick
+        while finish is None and text_size < _RESULTS_CHUNK_SIZE:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "text":
+                text_parts.append(item[1])
+                text_size += len(item[1])
+            elif item[0] == "progress":
+                progress = item[1:]  # only the latest count is worth drawing
+            else:
+                finish = item[1:]
+
+        if progress is not None:
+            done, total = progress
+            self.progress.config(value=done, maximum=total)
+            if not self._cancel_event.is_set():
+                self.status_label.config(text=f"Processed {done}/{total} files...", foreground="blue")
+
+        if text_parts:
+            self.results_text.configure(state="normal")
+            self.results_text.insert("end", "".join(text_parts))
+            self.results_text.configure(state="disabled")
+        if finish is None:
+            self.after(1 if text_size >= _RESULTS_CHUNK_SIZE else 50, self._drain_queue)
             return
 
-        target_files = self.find_target_files(folder_path)
+        self.results_text.see("end")
+        self.preview_button.config(state="normal")
+        self.apply_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        callback, args = finish
+        callback(*args)
+
+    def cancel_operation(self):
+        """Ask the running worker to stop after the current file."""
+        self._cancel_event.set()
+        self.cancel_button.config(state="disabled")
+        self.status_label.config(text="Cancelling...", foreground="orange")
+
+    def preview_changes(self):
+        """Preview what changes would be made."""
+        options = self._read_options()
+        if options is None:
+            return
+        self._start_worker(self._run_preview, options)
+
+    def _run_preview(self, options):
+        """Worker thread: scan the target files and queue the preview text."""
+        folder_path = options["folder_path"]
+        prefix = os.path.join(folder_path, "")
+        put = self._queue.put
+
+        target_files = self.find_target_files(folder_path, options["extensions"], options["vmt_smart_mode"])
 
         if not target_files:
-            self.results_text.delete("1.0", "end")
-            self.results_text.insert("1.0", "No files found matching the specified criteria.")
+            put(("text", "No files found matching the specified criteria."))
+            put(("done", self._finish_no_files, (False,)))
             return
 
-        preview_text = f"Preview of changes for search term '{search_text}':\n\n"
+        put(("text", f"Preview of changes for search term '{options['search_text']}':\n\n"))
 
         filename_changes = 0
         content_changes = 0
 
-        for file_path in target_files:
-            file_results = []
-
-            # Check filename changes
-            if rename_files:
-                filename = os.path.basename(file_path)
-                if self.search_in_filename(filename, search_text, case_sensitive, whole_words):
-                    new_path = self.replace_in_filename(file_path, search_text, replace_text,
-                                                        case_sensitive, whole_words)
-                    if new_path:
-                        file_results.append(f"  Filename: {filename} → {os.path.basename(new_path)}")
-                        filename_changes += 1
-
-            # Check content changes
-            if modify_contents:
-                matches = self.search_in_file_content(file_path, search_text, case_sensitive, whole_words)
-                if matches:
-                    file_results.append(f"  Content: Found on lines {', '.join(map(str, matches[:5]))}")
-                    if len(matches) > 5:
-                        file_results.append(f"    ... and {len(matches) - 5} more lines")
-                    content_changes += 1
-
-            if file_results:
-                preview_text += f"{os.path.relpath(file_path, folder_path)}:\n"
-                preview_text += "\n".join(file_results) + "\n\n"
-
-        preview_text += f"Summary:\n"
-        preview_text += f"Files with filename changes: {filename_changes}\n"
-        preview_text += f"Files with content changes: {content_changes}\n"
-
-        self.results_text.delete("1.0", "end")
-        self.results_text.insert("1.0", preview_text)
-
-        self.status_label.config(text=f"Preview complete: {filename_changes + content_changes} files affected",
+        # Files are independent and the work is mostly read syscalls, which
+        # release the GIL, so a thread pool overlaps the I/O latency
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            futures = [executor.submit(self._preview_one_file, file_path, options)
+                       for file_path in target_files]
+            total = len(futures)
+            for done, future in enumerate(as_completed(futures), 1):
+                if done % _PROGRESS_INTERVAL == 0 or done == total:
+                    put(("progress", done, total))
+                result = future.result()
+                if result is None:
+                    continue
+                file_path, file_results, filename_changed, content_matched = result
+                filename_changes += filename_changed
+                content_changes += content_matched
+                if file_results:
+                    put(("text", f"{_relative_to(file_path, prefix)}:\n"
+                                 + "\n".join(file_results) + "\n\n"))
+        cancelled = self._cancel_event.is_set()
+
+        summary = [f"Summary:\n"]
+        if cancelled:
+            summary.append("Preview cancelled; totals cover the files scanned so far.\n")
+        summary.append(f"Files with filename changes: {filename_changes}\n")
+        summary.append(f"Files with content changes: {content_changes}\n")
+        put(("text", "".join(summary)))
+        put(("done", self._finish_preview, (filename_changes, content_changes, cancelled)))
+
+    def _preview_one_file(self, file_path, options):
+        """
+        Preview the changes for one file (runs in the worker pool).
+        
+        Returns (file_path, file_results, filename_changed, content_matched),
+        or None if the run was cancelled before this file was reached.
+        """
+        if self._cancel_event.is_set():
+            return None
+
+        search_text = options["search_text"]
+        pattern = options["pattern"]
+        file_results = []
+        filename_changed = False
+        content_matched = False
+
+        # Check filename changes; replace_in_filename returns None when
+        # nothing matched, so a separate search pass would be redundant
+        if options["rename_files"]:
+            new_path = self.replace_in_filename(file_path, options["replacer"])
+            if new_path:
+                file_results.append(f"  Filename: {os.path.basename(file_path)} → {os.path.basename(new_path)}")
+                filename_changed = True
+
+        # Check content changes
+        if options["modify_contents"]:
+            matches = self.search_in_file_content(file_path, search_text, pattern)
+            if matches:
+                file_results.append(f"  Content: Found on lines {', '.join(map(str, matches[:5]))}")
+                if len(matches) > 5:
+                    file_results.append(f"    ... and {len(matches) - 5} more lines")
+                content_matched = True
+
+        return file_path, file_results, filename_changed, content_matched
+
+    def _finish_preview(self, filename_changes, content_changes, cancelled):
+        """Tk thread: report the preview result."""
+        state = "cancelled" if cancelled else "complete"
+        self.status_label.config(text=f"Preview {state}: {filename_changes + content_changes} files affected",
                                 foreground="blue")
 
     def apply_changes(self):
         """Apply the search and replace changes."""
-        folder_path = self.folder_path.get()
-        search_text = self.search_text.get()
-        replace_text = self.replace_text.get()
-
-        if not folder_path:
-            messagebox.showerror("Error", "Please select a folder first.")
-            return
-
-        if not search_text:
-            messagebox.showerror("Error", "Please enter text to search for.")
-            return
-
-        case_sensitive = self.case_sensitive_var.get()
-        whole_words = self.whole_words_var.get()
-        rename_files = self.rename_files_var.get()
-        modify_contents = self.modify_contents_var.get()
-        create_backup = self.create_backup_var.get()
-
-        if not rename_files and not modify_contents:
-            messagebox.showerror("Error", "Please select at least one option (filenames or contents).")
+        options = self._read_options()
+        if options is None:
             return
 
         # Confirm the operation
         result = messagebox.askyesno("Confirm Changes",
                                     f"Apply search and replace operation?\n\n"
-                                    f"Search: '{search_text}'\n"
-                                    f"Replace: '{replace_text}'\n\n"
-                                    f"Target: {folder_path}\n"
-                                    f"Backups: {'Yes' if create_backup else 'No'}")
+                                    f"Search: '{options['search_text']}'\n"
+                                    f"Replace: '{options['replace_text']}'\n\n"
+                                    f"Target: {options['folder_path']}\n"
+                                    f"Backups: {'Yes' if options['create_backup'] else 'No'}")
         if not result:
             return
 
-        target_files = self.find_target_files(folder_path)
+        self._start_worker(self._run_apply, options)
+
+    def _run_apply(self, options):
+        """Worker thread: rename and rewrite the target files and queue the results."""
+        folder_path = options["folder_path"]
+        prefix = os.path.join(folder_path, "")
+        put = self._queue.put
+
+        target_files = self.find_target_files(folder_path, options["extensions"], options["vmt_smart_mode"])
 
         if not target_files:
-            messagebox.showinfo("No Files", "No files found matching the specified criteria.")
+            put(("done", self._finish_no_files, (True,)))
             return
 
         files_renamed = 0
@@ -490,78 +779,115 @@ class SearchReplaceTab(ttk.Frame):
         total_replacements = 0
         errors = []
 
-        results_text = f"Search and Replace Results:\n\n"
+        put(("text", f"Search and Replace Results:\n\n"))
+
+        # Each file's rename + read + substitute + write is independent and
+        # spends its time in syscalls, so run them across a thread pool
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            futures = [executor.submit(self._apply_one_file, file_path, options)
+                       for file_path in target_files]
+            total = len(futures)
+            for done, future in enumerate(as_completed(futures), 1):
+                if done % _PROGRESS_INTERVAL == 0 or done == total:
+                    put(("progress", done, total))
+                result = future.result()
+                if result is None:
+                    continue
+                file_path, file_results, renamed, replacements, file_errors = result
+                files_renamed += renamed
+                if replacements > 0:
+                    files_content_changed += 1
+                    total_replacements += replacements
+                errors.extend(file_errors)
+                if file_results:
+                    put(("text", f"{_relative_to(file_path, prefix)}:\n"
+                                 + "\n".join(file_results) + "\n\n"))
+        cancelled = self._cancel_event.is_set()
+
+        # Summary
+        summary = [f"Operation Summary:\n"]
+        if cancelled:
+            summary.append("Operation cancelled; remaining files were left untouched.\n")
+        summary.append(f"Files renamed: {files_renamed}\n")
+        summary.append(f"Files with content changes: {files_content_changed}\n")
+        summary.append(f"Total text replacements: {total_replacements}\n")
+        summary.append(f"Errors: {len(errors)}\n\n")
+
+        if errors:
+            summary.append("Errors encountered:\n")
+            for error in errors[:10]:  # Show first 10 errors
+                summary.append(f"  {error}\n")
+            if len(errors) > 10:
+                summary.append(f"  ... and {len(errors) - 10} more errors\n")
+
+        put(("text", "".join(summary)))
+        put(("done", self._finish_apply,
+             (files_renamed, files_content_changed, total_replacements, len(errors), cancelled)))
+
+    def _apply_one_file(self, file_path, options):
+        """
+        Rename and rewrite one file (runs in the worker pool).
+        
+        Returns (final_path, file_results, renamed, replacements, errors),
+        or None if the run was cancelled before this file was reached.
+        """
+        if self._cancel_event.is_set():
+            return None
+
+        search_text = options["search_text"]
+        pattern = options["pattern"]
+        file_results = []
+        renamed = False
+        replacements = 0
+        errors = []
 
-        try:
-            for file_path in target_files:
-                file_changed = False
-                file_results = []
-
-                # Handle filename changes
-                if rename_files:
-                    filename = os.path.basename(file_path)
-                    if self.search_in_filename(filename, search_text, case_sensitive, whole_words):
-                        new_path = self.replace_in_filename(file_path, search_text, replace_text,
-                                                            case_sensitive, whole_words)
-                        if new_path:
-                            try:
-                                os.rename(file_path, new_path)
-                                file_results.append(f"  Renamed: {filename} → {os.path.basename(new_path)}")
-                                files_renamed += 1
-                                file_changed = True
-                                file_path = new_path  # Update path for content processing
-                            except Exception as e:
-                                errors.append(f"Error renaming {file_path}: {e}")
-
-                # Handle content changes
-                if modify_contents:
-                    matches = self.search_in_file_content(file_path, search_text, case_sensitive, whole_words)
-                    if matches:
-                        try:
-                            replacements = self.replace_in_file_content(file_path, search_text, replace_text,
-                                                                        case_sensitive, whole_words, create_backup)
-                            if replacements > 0:
-                                file_results.append(f"  Content: {replacements} replacements made")
-                                files_content_changed += 1
-                                total_replacements += replacements
-                                file_changed = True
-                        except Exception as e:
-                            errors.append(f"Error modifying content of {file_path}: {e}")
-
-                if file_changed:
-                    results_text += f"{os.path.relpath(file_path, folder_path)}:\n"
-                    results_text += "\n".join(file_results) + "\n\n"
-
-            # Summary
-            results_text += f"Operation Summary:\n"
-            results_text += f"Files renamed: {files_renamed}\n"
-            results_text += f"Files with content changes: {files_content_changed}\n"
-            results_text += f"Total text replacements: {total_replacements}\n"
-            results_text += f"Errors: {len(errors)}\n\n"
-
-            if errors:
-                results_text += "Errors encountered:\n"
-                for error in errors[:10]:  # Show first 10 errors
-                    results_text += f"  {error}\n"
-                if len(errors) > 10:
-                    results_text += f"  ... and {len(errors) - 10} more errors\n"
-
-            self.results_text.delete("1.0", "end")
-            self.results_text.insert("1.0", results_text)
-
-            # Show completion message
-            messagebox.showinfo("Operation Complete",
-                                f"Search and replace completed.\n\n"
-                                f"Files renamed: {files_renamed}\n"
-                                f"Files with content changes: {files_content_changed}\n"
-                                f"Total replacements: {total_replacements}\n"
-                                f"Errors: {len(errors)}")
-
-            self.status_label.config(
-                text=f"Complete: {files_renamed + files_content_changed} files processed, {len(errors)} errors",
-                foreground="green" if len(errors) == 0 else "orange"
-            )
+        # Handle filename changes (None from replace_in_filename means no match)
+        if options["rename_files"]:
+            new_path = self.replace_in_filename(file_path, options["replacer"])
+            if new_path:
+                try:
+                    os.rename(file_path, new_path)
+                    file_results.append(f"  Renamed: {os.path.basename(file_path)} → {os.path.basename(new_path)}")
+                    renamed = True
+                    file_path = new_path  # Update path for content processing
+                except Exception as e:
+                    errors.append(f"Error renaming {file_path}: {e}")
+
+        # Handle content changes; the replace reads each file once and
+        # leaves it untouched when nothing matches, so no search pass first
+        if options["modify_contents"]:
+            try:
+                replacements = self.replace_in_file_content(file_path, search_text, pattern,
+                                                            options["replacer"], options["create_backup"])
+                if replacements > 0:
+                    file_results.append(f"  Content: {replacements} replacements made")
+            except Exception as e:
+                errors.append(f"Error modifying content of {file_path}: {e}")
+
+        return file_path, file_results, renamed, replacements, errors
+
+    def _finish_apply(self, files_renamed, files_content_changed, total_replacements, error_count, cancelled):
+        """Tk thread: show the completion message for an apply run."""
+        messagebox.showinfo("Operation Cancelled" if cancelled else "Operation Complete",
+                            f"Search and replace {'cancelled' if cancelled else 'completed'}.\n\n"
+                            f"Files renamed: {files_renamed}\n"
+                            f"Files with content changes: {files_content_changed}\n"
+                            f"Total replacements: {total_replacements}\n"
+                            f"Errors: {error_count}")
+
+        self.status_label.config(
+            text=f"{'Cancelled' if cancelled else 'Complete'}: "
+                 f"{files_renamed + files_content_changed} files processed, {error_count} errors",
+            foreground="green" if error_count == 0 and not cancelled else "orange"
+        )
+
+    def _finish_no_files(self, show_dialog):
+        """Tk thread: report that no files matched the filters."""
+        if show_dialog:
+            messagebox.showinfo("No Files", "No files found matching the specified criteria.")
+        self.status_label.config(text="No matching files", foreground="orange")
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Operation failed: {e}")
-            self.status_label.config(text="Operation failed", foreground="red")
+    def _finish_failed(self, error):
+        """Tk thread: report a worker that stopped on an unexpected error."""
+        messagebox.showerror("Error", f"Operation failed: {error}")
+        self.status_label.config(text="Operation failed", foreground="red")
@@ -4,13 +4,151 @@ Soundscape Searcher Tool - Search and analyze soundscape files for sound referen
 
 import os
 import re
+import mmap
+from array import array
 import json
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 from .base_tool import BaseTool, register_tool
-from .utils import PlaceholderEntry, browse_folder, browse_folder_with_context
+from .utils import PlaceholderEntry, browse_folder, browse_folder_with_context, iter_files
+
+# Optional orjson fast path for saving results; falls back to json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Worker threads for the per-file scans; file reads release the GIL, so
+# a pool keeps several reads in flight while another file is matched
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files larger than this are checked for the search term through mmap
+# before they are read and decoded
+_MMAP_THRESHOLD = 64 * 1024
+
+# Matching lines shown in the log per file
+_SHOWN_MATCHES = 5
+
+# Filename keywords that mark a likely soundscape script
+_SOUNDSCAPE_KEYWORDS = ('soundscape', 'sound', 'ambient')
+
+# Soundscape block header, e.g. "soundscape_name" {, with the position of
+# the opening brace captured so the block scan can start right there
+_BLOCK_HEADER_RE = re.compile(r'(?P<name>["\']?\w+["\']?)\s*(?P<brace>\{)')
+
+
+@lru_cache(maxsize=64)
+def _compile_search(search_term, case_sensitive, regex_search, whole_words):
+    """
+    Compile the search into one pattern for a whole search.
+    
+    Plain terms are escaped so they can be scanned over the whole file
+    at once; regexes are run line by line. Raises re.error for an invalid regex,
+    so a bad pattern is reported once up front. Cached, so re-running a
+    search with other folders or extensions skips compiling again.
+    
+    Returns (pattern, needle). needle is the literal every match must
+    contain, lowercased for case-insensitive searches, or None for
+    regex searches where no such literal is known.
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    if regex_search:
+        return re.compile(search_term, flags), None
+    pattern = re.escape(search_term)
+    if whole_words:
+        pattern = r'\b' + pattern + r'\b'
+    return re.compile(pattern, flags), search_term if case_sensitive else search_term.lower()
+
+
+def _mapped_contains(file_path, needle, ignore_case):
+    """
+    Check a file for a literal without reading it into a Python string.
+    
+    Searches the raw bytes through mmap, so a large file that misses is
+    never decoded. ignore_case needs an ASCII needle, since only ASCII
+    is folded at the bytes level.
+    """
+    needle_bytes = needle.encode('utf-8')
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if ignore_case:
+            return re.search(re.escape(needle_bytes), mm, re.IGNORECASE) is not None
+        return mm.find(needle_bytes) != -1
+
+
+def _relative_to(path, root_folder, prefix):
+    """
+    Path of a found file relative to the searched folder.
+    
+    Found paths are built by joining onto the folder, so slicing off
+    prefix (the folder plus a separator) matches os.path.relpath without
+    normalizing every path; anything else falls back to relpath.
+    """
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    return os.path.relpath(path, root_folder)
+
+
+def _json_dumps(value):
+    """Encode value as indent=2 JSON text, through orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def _dump_json_streaming(f, header, key, entries):
+    """
+    Write header fields and a key -> {name: value} mapping as JSON.
+    
+    Produces the same layout as json.dump(..., indent=2) of the whole
+    document, but encodes one (name, value) entry at a time, so the
+    full JSON tree is never built in memory.
+    """
+    f.write('{\n')
+    for name, value in header.items():
+        f.write(f'  {_json_dumps(name)}: {_json_dumps(value)},\n')
+    f.write(f'  {_json_dumps(key)}: {{')
+    empty = True
+    for name, value in entries:
+        f.write('\n' if empty else ',\n')
+        empty = False
+        # Nested two levels deep; json escapes newlines inside strings,
+        # so every real newline here is a line break of the layout
+        f.write(f'    {_json_dumps(name)}: ' + _json_dumps(value).replace('\n', '\n    '))
+    f.write('}\n}' if empty else '\n  }\n}')
+
+
+def _match_braces(text, block_start):
+    """
+    Find the brace closing the block that opens at text[block_start].
+    
+    Returns (block_text, end_pos), or (None, len(text)) when the block is
+    never closed. Jumps between braces with str.find instead of stepping
+    through every character.
+    """
+    i = block_start + 1
+    depth = 1
+    next_open = text.find('{', i)
+    while depth > 0:
+        close = text.find('}', i)
+        if close == -1:
+            return None, len(text)
+        if next_open != -1 and next_open < close:
+            depth += 1
+            i = next_open + 1
+            next_open = text.find('{', i)
+        else:
+            depth -= 1
+            i = close + 1
+    
+    return text[block_start:i], i
+
 
 @register_tool
 class SoundscapeSearcherTool(BaseTool):
@@ -30,15 +168,39 @@ class SoundscapeSearcherTool(BaseTool):
         return SoundscapeSearcherTab(parent, self.config)
 
 class TextHandler(logging.Handler):
-    """Logging handler for Tkinter Text widget."""
+    """
+    Logging handler for Tkinter Text widget.
+    
+    Lines are buffered and written in one insert every FLUSH_MS, or as
+    soon as MAX_PENDING lines are waiting, so a large search costs one
+    widget reconfigure and redraw per batch rather than per message.
+    """
+    FLUSH_MS = 100
+    MAX_PENDING = 200
+    
     def __init__(self, widget):
         super().__init__()
         self.widget = widget
+        self.pending = []
+        self._flush_id = None
         
     def emit(self, record):
-        msg = self.format(record)
+        self.pending.append(self.format(record) + '\n')
+        if len(self.pending) >= self.MAX_PENDING:
+            if self._flush_id is not None:
+                self.widget.after_cancel(self._flush_id)
+            self._flush()
+        elif self._flush_id is None:
+            self._flush_id = self.widget.after(self.FLUSH_MS, self._flush)
+    
+    def _flush(self):
+        self._flush_id = None
+        if not self.pending:
+            return
+        text = ''.join(self.pending)
+        self.pending.clear()
         self.widget.configure(state='normal')
-        self.widget.insert(tk.END, msg + '\n')
+        self.widget.insert(tk.END, text)
         self.widget.configure(state='disabled')
         self.widget.see(tk.END)
 
@@ -46,6 +208,7 @@ class SoundscapeSearcherTab(ttk.Frame):
     def __init__(self, parent, config):
         super().__init__(parent)
         self.config = config
+        self._queue = queue.Queue()
         self.setup_ui()
         self.setup_logging()
     
@@ -113,10 +276,12 @@ class SoundscapeSearcherTab(ttk.Frame):
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill="x", pady=(0, 10))
         
-        ttk.Button(button_frame, text="Search Files", 
-                  command=self.search_files).pack(side="left")
-        ttk.Button(button_frame, text="Extract Soundscape Blocks", 
-                  command=self.extract_soundscape_blocks).pack(side="left", padx=(10, 0))
+        self.search_button = ttk.Button(button_frame, text="Search Files", 
+                                        command=self.search_files)
+        self.search_button.pack(side="left")
+        self.extract_button = ttk.Button(button_frame, text="Extract Soundscape Blocks", 
+                                         command=self.extract_soundscape_blocks)
+        self.extract_button.pack(side="left", padx=(10, 0))
         ttk.Button(button_frame, text="Clear Log", 
                   command=self.clear_log).pack(side="right")
         
@@ -179,52 +344,157 @@ class SoundscapeSearcherTab(ttk.Frame):
         if not os.path.exists(root_path):
             return matching_files
         
-        for root, dirs, files in os.walk(root_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                
-                # Check if file matches any extension
-                for ext in extensions:
-                    ext_pattern = ext[1:]  # Remove *
-                    if file.lower().endswith(ext_pattern):
-                        matching_files.append(file_path)
-                        break
+        # One endswith call per file; the patterns are already lowercased
+        suffixes = tuple(ext[1:] for ext in extensions)  # Remove *
+        
+        # scandir entries carry the name and type from the directory read,
+        # so the walk needs no extra stat or path join per file
+        for entry in iter_files(root_path, suffixes):
+            matching_files.append(entry.path)
         
         return matching_files
     
-    def search_in_file(self, file_path, search_term, case_sensitive, regex_search, whole_words):
-        """Search for term in a file and return matches."""
-        matches = []
+    def search_in_file(self, file_path, pattern, needle=None):
+        """
+        Search for term in a file.
+        
+        Returns (content, spans): the decoded text and a flat array of
+        (line_num, line_start, line_end) triples, one per matching line.
+        Lines are sliced out of content only when they are needed.
+        """
+        matches = array('q')
+        content = ''
+        ignore_case = pattern.flags & re.IGNORECASE
+        # Literal terms never contain a newline, so only a regex can match
+        # across lines
+        regex_search = needle is None
+        
+        if needle is not None and (needle.isascii() or not ignore_case) \
+                and os.path.getsize(file_path) > _MMAP_THRESHOLD:
+            if not _mapped_contains(file_path, needle, ignore_case):
+                return content, matches
+            needle = None  # known to be present, skip the text check below
+        
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
         
+        if regex_search:
+            # Search each line on its own, newline included as in a
+            # line-by-line read, so \s, [^x] and the like can't match
+            # across lines and ^, $ and \A keep their per-line meaning
+            search = pattern.search
+            size = len(content)
+            line_start = 0
+            line_num = 0
+            while line_start < size:
+                line_end = content.find('\n', line_start)
+                if line_end == -1:
+                    line_end = size
+                line_num += 1
+                if search(content[line_start:line_end + 1]):
+                    matches.extend((line_num, line_start, line_end))
+                line_start = line_end + 1
+            return content, matches
+        
+        # Most files don't contain the term at all; a plain substring test
+        # on the text lowered once rejects them before any regex work.
+        # This beats an IGNORECASE regex scan, which folds case per character
+        pos = 0
+        if needle is not None:
+            haystack = content.lower() if ignore_case else content
+            first = haystack.find(needle)
+            if first == -1:
+                return content, matches
+            # No match starts before the first literal hit, so the regex can
+            # skip ahead; lowering non-ASCII text can change its length, in
+            # which case the offset doesn't map back and the scan starts at 0
+            if len(haystack) == len(content):
+                pos = first
+        
+        # Literal search: one scan over the whole file; after a hit, resume
+        # at the next line so each matching line is reported once
+        line_num = 1
+        counted_to = 0
+        while True:
+            match = pattern.search(content, pos)
+            if match is None:
+                break
+            start = match.start()
+            line_num += content.count('\n', counted_to, start)
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', start)
+            if line_end == -1:
+                line_end = len(content)
+            matches.extend((line_num, line_start, line_end))
+            pos = counted_to = line_end
+            if pos >= len(content):
+                break
+            pos += 1
+        
+        return content, matches
+    
+    def _search_one_file(self, file_path, pattern, needle, keep_all):
+        """
+        Search one file (runs in the worker pool).
+        
+        Returns (match_count, lines, error), where lines holds the
+        (line_num, text) of every match when keep_all is set (for saving)
+        and only the ones shown in the log otherwise.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    if self.line_matches(line, search_term, case_sensitive, regex_search, whole_words):
-                        matches.append((line_num, line.strip()))
-        
+            content, spans = self.search_in_file(file_path, pattern, needle)
         except Exception as e:
-            self.logger.error(f"Error reading {file_path}: {e}")
+            return 0, [], f"Error reading {file_path}: {e}"
         
-        return matches
+        match_count = len(spans) // 3
+        shown = match_count if keep_all else min(match_count, _SHOWN_MATCHES)
+        lines = [(spans[i], content[spans[i + 1]:spans[i + 2]].strip())
+                 for i in range(0, shown * 3, 3)]
+        return match_count, lines, None
     
-    def line_matches(self, line, search_term, case_sensitive, regex_search, whole_words):
-        """Check if a line matches the search criteria."""
-        if regex_search:
+    def _log(self, message, level=logging.INFO):
+        """Queue a log line from the worker thread for the Tk thread to write."""
+        self._queue.put(("log", level, message))
+    
+    def _start_worker(self, target, *args):
+        """Run target(*args) on a worker thread, with the buttons locked until it finishes."""
+        self.search_button.config(state="disabled")
+        self.extract_button.config(state="disabled")
+        threading.Thread(target=self._run_worker, args=(target, args), daemon=True).start()
+        self.after(50, self._drain_queue)
+    
+    def _run_worker(self, target, args):
+        """Worker thread body: report unexpected failures instead of dying silently."""
+        try:
+            target(*args)
+        except Exception as e:
+            self._queue.put(("done", self._finish_failed, (e,)))
+    
+    def _drain_queue(self):
+        """Tk thread: write queued log lines and run the finish step once the worker is done."""
+        while True:
             try:
-                flags = 0 if case_sensitive else re.IGNORECASE
-                return bool(re.search(search_term, line, flags))
-            except re.error:
-                return False
-        else:
-            search_target = line if case_sensitive else line.lower()
-            search_pattern = search_term if case_sensitive else search_term.lower()
-            
-            if whole_words:
-                pattern = r'\\b' + re.escape(search_pattern) + r'\\b'
-                flags = 0 if case_sensitive else re.IGNORECASE
-                return bool(re.search(pattern, search_target, flags))
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == "log":
+                self.logger.log(item[1], item[2])
             else:
-                return search_pattern in search_target
+                self.search_button.config(state="normal")
+                self.extract_button.config(state="normal")
+                callback, args = item[1:]
+                callback(*args)
+                return
+        self.after(50, self._drain_queue)
+    
+    def _finish_status(self, text, foreground):
+        """Tk thread: show the final status of a search or extraction."""
+        self.status_label.config(text=text, foreground=foreground)
+    
+    def _finish_failed(self, error):
+        """Tk thread: report a worker that died with an unexpected error."""
+        self.logger.error(f"Operation failed: {error}")
+        self.status_label.config(text="Operation failed", foreground="red")
     
     def search_files(self):
         """Search for the specified term in files."""
@@ -244,50 +514,72 @@ class SoundscapeSearcherTab(ttk.Frame):
         regex_search = self.regex_search_var.get()
         whole_words = self.whole_words_var.get()
         
+        try:
+            pattern, needle = _compile_search(search_term, case_sensitive, regex_search, whole_words)
+        except re.error as e:
+            messagebox.showerror("Error", f"Invalid regular expression: {e}")
+            return
+        
         self.logger.info(f"Searching for '{search_term}' in {root_folder}")
         self.logger.info(f"File extensions: {', '.join(extensions)}")
         self.logger.info(f"Options: Case sensitive={case_sensitive}, Regex={regex_search}, Whole words={whole_words}")
+        self.status_label.config(text="Searching...", foreground="blue")
         
+        self._start_worker(self._run_search, root_folder, search_term, extensions, pattern, needle,
+                           self.save_results_var.get())
+    
+    def _run_search(self, root_folder, search_term, extensions, pattern, needle, save_results):
+        """Worker thread: scan the files and queue the log lines and final status."""
         # Find matching files
         matching_files = self.find_files(root_folder, extensions)
         
         if not matching_files:
-            self.logger.info("No files found matching the specified extensions.")
-            self.status_label.config(text="No files found", foreground="orange")
+            self._log("No files found matching the specified extensions.")
+            self._queue.put(("done", self._finish_status, ("No files found", "orange")))
             return
         
-        self.logger.info(f"Scanning {len(matching_files)} files...")
+        self._log(f"Scanning {len(matching_files)} files...")
+        prefix = os.path.join(root_folder, "")
         
         total_matches = 0
         files_with_matches = 0
         search_results = {}
         
-        for file_path in matching_files:
-            matches = self.search_in_file(file_path, search_term, case_sensitive, regex_search, whole_words)
-            
-            if matches:
+        # Files are independent; map keeps the log in walk order while the
+        # pool reads ahead
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            count = len(matching_files)
+            scans = executor.map(self._search_one_file, matching_files,
+                                 [pattern] * count, [needle] * count, [save_results] * count)
+            for file_path, (match_count, lines, error) in zip(matching_files, scans):
+                if error:
+                    self._log(error, logging.ERROR)
+                if not match_count:
+                    continue
+                
                 files_with_matches += 1
-                total_matches += len(matches)
-                search_results[file_path] = matches
+                total_matches += match_count
+                if save_results:
+                    search_results[file_path] = lines
                 
-                rel_path = os.path.relpath(file_path, root_folder)
-                self.logger.info(f"\\n{rel_path} ({len(matches)} matches):")
+                rel_path = _relative_to(file_path, root_folder, prefix)
+                self._log(f"\\n{rel_path} ({match_count} matches):")
                 
-                for line_num, line_content in matches[:5]:  # Show first 5 matches per file
-                    self.logger.info(f"  Line {line_num}: {line_content[:100]}{'...' if len(line_content) > 100 else ''}")
+                for line_num, line_content in lines[:_SHOWN_MATCHES]:
+                    self._log(f"  Line {line_num}: {line_content[:100]}{'...' if len(line_content) > 100 else ''}")
                 
-                if len(matches) > 5:
-                    self.logger.info(f"  ... and {len(matches) - 5} more matches")
+                if match_count > _SHOWN_MATCHES:
+                    self._log(f"  ... and {match_count - _SHOWN_MATCHES} more matches")
         
-        self.logger.info(f"\\nSearch complete!")
-        self.logger.info(f"Found {total_matches} matches in {files_with_matches} files.")
+        self._log(f"\\nSearch complete!")
+        self._log(f"Found {total_matches} matches in {files_with_matches} files.")
         
         # Save results if requested
-        if self.save_results_var.get() and search_results:
+        if save_results and search_results:
             self.save_search_results(search_results, search_term, root_folder)
         
-        self.status_label.config(text=f"Search complete: {total_matches} matches in {files_with_matches} files", 
-                                foreground="green")
+        self._queue.put(("done", self._finish_status,
+                         (f"Search complete: {total_matches} matches in {files_with_matches} files", "green")))
     
     def save_search_results(self, results, search_term, root_folder):
         """Save search results to a file."""
@@ -296,59 +588,72 @@ class SoundscapeSearcherTab(ttk.Frame):
             output_filename = f"search_results_{search_term.replace(' ', '_')}_{timestamp}.json"
             output_path = os.path.join(root_folder, output_filename)
             
-            # Prepare data for JSON
-            json_data = {
+            header = {
                 "search_term": search_term,
                 "root_folder": root_folder,
                 "timestamp": timestamp,
                 "total_matches": sum(len(matches) for matches in results.values()),
                 "files_with_matches": len(results),
-                "results": {}
             }
             
-            for file_path, matches in results.items():
-                rel_path = os.path.relpath(file_path, root_folder)
-                json_data["results"][rel_path] = {
-                    "match_count": len(matches),
-                    "matches": [{"line": line_num, "content": content} for line_num, content in matches]
-                }
+            # Entries are built one file at a time as they are written
+            prefix = os.path.join(root_folder, "")
+            entries = ((_relative_to(file_path, root_folder, prefix), {
+                "match_count": len(matches),
+                "matches": [{"line": line_num, "content": content} for line_num, content in matches]
+            }) for file_path, matches in results.items())
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+                _dump_json_streaming(f, header, "results", entries)
             
-            self.logger.info(f"Results saved to: {output_filename}")
+            self._log(f"Results saved to: {output_filename}")
             
         except Exception as e:
-            self.logger.error(f"Failed to save results: {e}")
+            self._log(f"Failed to save results: {e}", logging.ERROR)
     
     def extract_block(self, text, start_pos):
         """Extract a block from text starting at a position."""
-        depth = 0
-        i = start_pos
-        
         # Find the opening brace
-        while i < len(text) and text[i] != '{':
-            i += 1
-        
-        if i >= len(text):
-            return None, i
-        
-        block_start = i
-        i += 1
-        depth = 1
-        
-        # Find the matching closing brace
-        while i < len(text) and depth > 0:
-            if text[i] == '{':
-                depth += 1
-            elif text[i] == '}':
-                depth -= 1
-            i += 1
-        
-        if depth == 0:
-            return text[block_start:i], i
-        else:
-            return None, i
+        block_start = text.find('{', start_pos)
+        if block_start == -1:
+            return None, len(text)
+        
+        return _match_braces(text, block_start)
+    
+    def _extract_file_blocks(self, file_path):
+        """Extract the soundscape blocks of one file (runs in the worker pool); returns (blocks, error)."""
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            
+            file_blocks = []
+            
+            # No brace means no block; skip the decode and regex entirely
+            if b'{' not in raw:
+                return file_blocks, None
+            
+            content = raw.decode('utf-8', errors='ignore')
+            if '\r' in content:
+                # Same newlines as a text-mode read, so offsets match
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            
+            # Look for soundscape block patterns
+            # Common patterns: "soundscape_name" { ... }
+            for match in _BLOCK_HEADER_RE.finditer(content):
+                block_name = match.group('name').strip('\'"')
+                block_content, end_pos = _match_braces(content, match.start('brace'))
+                
+                if block_content:
+                    file_blocks.append({
+                        "name": block_name,
+                        "content": block_content,
+                        "start_pos": match.start(),
+                        "end_pos": end_pos
+                    })
+            
+            return file_blocks, None
+        except Exception as e:
+            return [], f"Error processing {file_path}: {e}"
     
     def extract_soundscape_blocks(self):
         """Extract soundscape blocks from files."""
@@ -358,85 +663,75 @@ class SoundscapeSearcherTab(ttk.Frame):
             messagebox.showerror("Error", "Please select a root folder first.")
             return
         
-        # Look for soundscape files
-        soundscape_extensions = ["*.txt"]
-        soundscape_files = self.find_files(root_folder, soundscape_extensions)
+        self.status_label.config(text="Extracting...", foreground="blue")
+        self._start_worker(self._run_extraction, root_folder, self.save_results_var.get())
+    
+    def _run_extraction(self, root_folder, save_results):
+        """Worker thread: extract blocks from the soundscape files and queue the log lines."""
+        # Look for soundscape files; one walk serves both the filtered
+        # list and the all-text-files fallback
+        text_files = self.find_files(root_folder, ["*.txt"])
         
         # Filter for likely soundscape files
-        soundscape_files = [f for f in soundscape_files if 
+        soundscape_files = [f for f in text_files if 
                            any(keyword in os.path.basename(f).lower() 
-                               for keyword in ['soundscape', 'sound', 'ambient'])]
+                               for keyword in _SOUNDSCAPE_KEYWORDS)]
         
         if not soundscape_files:
-            self.logger.info("No soundscape files found. Searching all text files...")
-            soundscape_files = self.find_files(root_folder, ["*.txt"])
+            self._log("No soundscape files found. Searching all text files...")
+            soundscape_files = text_files
         
         if not soundscape_files:
-            messagebox.showinfo("No Files", "No text files found to analyze.")
+            self._queue.put(("done", self._finish_no_text_files, ()))
             return
         
-        self.logger.info(f"Analyzing {len(soundscape_files)} files for soundscape blocks...")
+        self._log(f"Analyzing {len(soundscape_files)} files for soundscape blocks...")
+        prefix = os.path.join(root_folder, "")
         
         total_blocks = 0
         output_data = {}
         
-        for file_path in soundscape_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                rel_path = os.path.relpath(file_path, root_folder)
-                file_blocks = []
-                
-                # Look for soundscape block patterns
-                # Common patterns: "soundscape_name" { ... }
-                pattern = r'(["\']?\\w+["\']?)\\s*{'
-                matches = list(re.finditer(pattern, content, re.MULTILINE))
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            extractions = executor.map(self._extract_file_blocks, soundscape_files)
+            for file_path, (file_blocks, error) in zip(soundscape_files, extractions):
+                if error:
+                    self._log(error, logging.ERROR)
+                if not file_blocks:
+                    continue
                 
-                for match in matches:
-                    block_name = match.group(1).strip('\'"')
-                    block_content, end_pos = self.extract_block(content, match.start())
-                    
-                    if block_content:
-                        file_blocks.append({
-                            "name": block_name,
-                            "content": block_content,
-                            "start_pos": match.start(),
-                            "end_pos": end_pos
-                        })
-                        total_blocks += 1
-                
-                if file_blocks:
-                    output_data[rel_path] = file_blocks
-                    self.logger.info(f"{rel_path}: Found {len(file_blocks)} blocks")
-                
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
+                rel_path = _relative_to(file_path, root_folder, prefix)
+                total_blocks += len(file_blocks)
+                output_data[rel_path] = file_blocks
+                self._log(f"{rel_path}: Found {len(file_blocks)} blocks")
         
-        self.logger.info(f"\\nExtraction complete! Found {total_blocks} soundscape blocks.")
+        self._log(f"\\nExtraction complete! Found {total_blocks} soundscape blocks.")
         
         # Save extracted blocks if requested
-        if self.save_results_var.get() and output_data:
+        if save_results and output_data:
             try:
                 timestamp = __import__('datetime').datetime.now().strftime("%Y%m%d_%H%M%S")
                 output_filename = f"soundscape_blocks_{timestamp}.json"
                 output_path = os.path.join(root_folder, output_filename)
                 
-                json_output = {
+                header = {
                     "extraction_timestamp": timestamp,
                     "root_folder": root_folder,
                     "total_blocks": total_blocks,
                     "files_processed": len(soundscape_files),
-                    "blocks": output_data
                 }
                 
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_output, f, indent=2, ensure_ascii=False)
+                    _dump_json_streaming(f, header, "blocks", output_data.items())
                 
-                self.logger.info(f"Blocks saved to: {output_filename}")
+                self._log(f"Blocks saved to: {output_filename}")
                 
             except Exception as e:
-                self.logger.error(f"Failed to save blocks: {e}")
+                self._log(f"Failed to save blocks: {e}", logging.ERROR)
         
-        self.status_label.config(text=f"Extraction complete: {total_blocks} blocks found", 
-                                foreground="green")
+        self._queue.put(("done", self._finish_status,
+                         (f"Extraction complete: {total_blocks} blocks found", "green")))
+    
+    def _finish_no_text_files(self):
+        """Tk thread: report that there was nothing to extract from."""
+        self.status_label.config(text="No files found", foreground="orange")
+        messagebox.showinfo("No Files", "No text files found to analyze.")
@@ -20,6 +20,23 @@ try:
 except ImportError:
     VTFLIB_AVAILABLE = False
 
+# Texture file extensions tried for VMT references, in priority order
+_TEXTURE_EXTENSIONS = ('.vtf', '.tga', '.png', '.jpg', '.jpeg')
+
+# Common VMT texture parameters, compiled once - basetexture first, as it
+# is the one auto-loaded
+_VMT_TEXTURE_PARAMS = tuple((re.compile(pattern, re.IGNORECASE), param_type) for pattern, param_type in (
+    (r'\$basetexture\s+"?([^"\s]+)"?', 'basetexture'),
+    (r'\$bumpmap\s+"?([^"\s]+)"?', 'bumpmap'),
+    (r'\$normalmap\s+"?([^"\s]+)"?', 'normalmap'),
+    (r'\$detail\s+"?([^"\s]+)"?', 'detail'),
+    (r'\$envmapmask\s+"?([^"\s]+)"?', 'envmapmask'),
+    (r'\$phongexponenttexture\s+"?([^"\s]+)"?', 'phongexponent'),
+    (r'\$phongwarptexture\s+"?([^"\s]+)"?', 'phongwarp'),
+    (r'\$selfillummask\s+"?([^"\s]+)"?', 'selfillum'),
+    (r'\$blendmodulatetexture\s+"?([^"\s]+)"?', 'blendmodulate'),
+))
+
 class Region:
     """Represents a rectangular region for extraction."""
     def __init__(self, name, x, y, w, h):
@@ -156,6 +173,9 @@ class SubtextureExtractionTab(ttk.Frame):
         # VMT processing
         self.vmt_file_path = None
         self.related_textures = []
+        # Workspace folder -> {lowercased filename: [paths in walk order]},
+        # built on first search of each folder and kept for the session
+        self._workspace_index = {}
 
         self.setup_ui()
 
@@ -472,28 +492,20 @@ class SubtextureExtractionTab(ttk.Frame):
                 vmt_content = f.read()
 
             print(f"VMT Content Preview: {vmt_content[:200]}...")  # Debug output
-            vmt_content_lower = vmt_content.lower()
-
-            # Common VMT texture parameters - prioritize basetexture first
-            texture_params = [
-                (r'\$basetexture\s+"?([^"\s]+)"?', 'basetexture'),
-                (r'\$bumpmap\s+"?([^"\s]+)"?', 'bumpmap'),
-                (r'\$normalmap\s+"?([^"\s]+)"?', 'normalmap'),
-                (r'\$detail\s+"?([^"\s]+)"?', 'detail'),
-                (r'\$envmapmask\s+"?([^"\s]+)"?', 'envmapmask'),
-                (r'\$phongexponenttexture\s+"?([^"\s]+)"?', 'phongexponent'),
-                (r'\$phongwarptexture\s+"?([^"\s]+)"?', 'phongwarp'),
-                (r'\$selfillummask\s+"?([^"\s]+)"?', 'selfillum'),
-                (r'\$blendmodulatetexture\s+"?([^"\s]+)"?', 'blendmodulate')
-            ]
 
             self.related_textures = []
             base_texture_path = None
             base_dir = os.path.dirname(self.vmt_file_path)
+            search_dirs = [
+                base_dir,  # Same directory as VMT
+                os.path.join(base_dir, '..', 'materials'),  # Parent materials folder
+                os.path.join(base_dir, '..'),  # Parent directory
+                os.path.dirname(base_dir)  # One level up from VMT directory
+            ]
 
             # Search for textures in priority order
-            for param_pattern, param_type in texture_params:
-                matches = re.findall(param_pattern, vmt_content_lower)
+            for param_re, param_type in _VMT_TEXTURE_PARAMS:
+                matches = param_re.findall(vmt_content)
                 print(f"Searching for {param_type}: found {len(matches)} matches")  # Debug
                 for match in matches:
                     # Clean up the texture path
@@ -502,15 +514,8 @@ class SubtextureExtractionTab(ttk.Frame):
 
                     # Try different file extensions and locations
                     found_texture = None
-                    for ext in ['.vtf', '.tga', '.png', '.jpg', '.jpeg']:
+                    for ext in _TEXTURE_EXTENSIONS:
                         # First try the basic relative search
-                        search_dirs = [
-                            base_dir,  # Same directory as VMT
-                            os.path.join(base_dir, '..', 'materials'),  # Parent materials folder
-                            os.path.join(base_dir, '..'),  # Parent directory
-                            os.path.dirname(base_dir)  # One level up from VMT directory
-                        ]
-
                         for search_dir in search_dirs:
                             if not search_dir:
                                 continue
@@ -532,11 +537,11 @@ class SubtextureExtractionTab(ttk.Frame):
                         if found_texture:
                             break
 
-                        # If not found locally, do a comprehensive workspace search
-                        print(f"Local search failed for {texture_path}{ext}, searching workspace...")
-                        found_texture = self.search_texture_in_workspace(texture_path, ext)
-                        if found_texture:
-                            break
+                    # If not found locally, do one comprehensive workspace search
+                    # covering every extension
+                    if not found_texture:
+                        print(f"Local search failed for {texture_path}, searching workspace...")
+                        found_texture = self.search_texture_in_workspace(texture_path, _TEXTURE_EXTENSIONS)
 
                     if found_texture and found_texture not in self.related_textures:
                         self.related_textures.append(found_texture)
@@ -584,11 +589,8 @@ class SubtextureExtractionTab(ttk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to analyze VMT file: {e}")
 
-    def search_texture_in_workspace(self, texture_path, extension):
-        """Search for a texture file across all workspace folders."""
-        # Get the base filename from the texture path
-        texture_filename = os.path.basename(texture_path) + extension
-
+    def search_texture_in_workspace(self, texture_path, extensions):
+        """Search for a texture file across all workspace folders, trying each extension in order."""
         # Get all workspace root folders from the environment
         workspace_folders = [
             "a:\\Source 2 Exports",
@@ -601,72 +603,100 @@ class SubtextureExtractionTab(ttk.Frame):
             "s:\\SteamLibrary\\steamapps\\common\\GarrysMod\\garrysmod\\addons\\Half-Life Alyx Combine Extended"
         ]
 
-        # Search patterns to try
-        search_patterns = [
-            texture_path + extension,  # Full path as specified in VMT
-            texture_filename,  # Just the filename
-            texture_path.split('/')[-1] + extension,  # Last part of path + extension
-        ]
+        # Drop roots missing on this machine once, not once per extension
+        workspace_folders = [folder for folder in workspace_folders if os.path.exists(folder)]
 
-        # Remove materials/ prefix if present and try again
-        if texture_path.startswith('materials/'):
-            clean_path = texture_path[10:]  # Remove 'materials/' prefix
-            search_patterns.append(clean_path + extension)
+        # VMTs write paths in any case; match the known prefixes against a
+        # lowered copy and slice the original with the same offsets
+        texture_path_lower = texture_path.lower()
+        hlvr_pos = texture_path_lower.rfind('riggs9162/hlvr/')
 
-        # Add common Source engine path variations
-        search_patterns.extend([
-            f"materials/{texture_path}" + extension,  # Add materials/ prefix
-            f"materials/models/{texture_path}" + extension,  # Add materials/models/ prefix
-            f"riggs9162/hlvr/" + texture_path.split('riggs9162/hlvr/')[-1] + extension if 'riggs9162/hlvr/' in texture_path else None,
-        ])
+        for extension in extensions:
+            # Get the base filename from the texture path
+            texture_filename = os.path.basename(texture_path) + extension
 
-        # Remove None values
-        search_patterns = [p for p in search_patterns if p is not None]
+            # Search patterns to try
+            search_patterns = [
+                texture_path + extension,  # Full path as specified in VMT
+                texture_filename,  # Just the filename
+                texture_path.split('/')[-1] + extension,  # Last part of path + extension
+            ]
 
-        print(f"Searching workspace for texture: {texture_path}{extension}")
-        print(f"Search patterns: {search_patterns}")
+            # Remove materials/ prefix if present and try again
+            if texture_path_lower.startswith('materials/'):
+                clean_path = texture_path[10:]  # Remove 'materials/' prefix
+                search_patterns.append(clean_path + extension)
+
+            # Add common Source engine path variations
+            search_patterns.extend([
+                f"materials/{texture_path}" + extension,  # Add materials/ prefix
+                f"materials/models/{texture_path}" + extension,  # Add materials/models/ prefix
+                "riggs9162/hlvr/" + texture_path[hlvr_pos + len('riggs9162/hlvr/'):] + extension if hlvr_pos != -1 else None,
+            ])
+
+            # Remove None values
+            search_patterns = [p for p in search_patterns if p is not None]
+
+            print(f"Searching workspace for texture: {texture_path}{extension}")
+            print(f"Search patterns: {search_patterns}")
+
+            for workspace_folder in workspace_folders:
+                # First, try direct construction for vault-materials structure
+                if 'vault-materials' in workspace_folder:
+                    direct_path = os.path.join(workspace_folder, 'materials', texture_path + extension)
+                    if os.path.exists(direct_path):
+                        print(f"Found texture (direct construction): {direct_path}")
+                        return direct_path
+
+                for pattern in search_patterns:
+                    # Try direct path construction first
+                    direct_path = os.path.join(workspace_folder, pattern)
+                    if os.path.exists(direct_path):
+                        print(f"Found texture (direct): {direct_path}")
+                        return direct_path
+
+                    # Look the filename up in the folder's index instead of
+                    # walking the whole tree again; a relative path match
+                    # implies a filename match, so the first hit covers both
+                    candidates = self._get_workspace_index(workspace_folder).get(os.path.basename(pattern).lower())
+                    if candidates:
+                        print(f"Found texture: {candidates[0]}")
+                        return candidates[0]
+
+        print(f"Texture not found in workspace: {texture_path}")
+        return None
 
-        for workspace_folder in workspace_folders:
-            if not os.path.exists(workspace_folder):
+    def _get_workspace_index(self, workspace_folder):
+        """
+        Return the filename index of a workspace folder, building it on first use.
+        
+        Maps each lowercased filename to its paths in the same top-down
+        order os.walk would visit them, so the first entry is the file the
+        old per-search walk would have returned.
+        """
+        index = self._workspace_index.get(workspace_folder)
+        if index is not None:
+            return index
+
+        index = {}
+        stack = [workspace_folder]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
                 continue
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    index.setdefault(entry.name.lower(), []).append(entry.path)
+            # Reversed so the first subdirectory is popped first
+            stack.extend(reversed(subdirs))
 
-            # First, try direct construction for vault-materials structure
-            if 'vault-materials' in workspace_folder:
-                direct_path = os.path.join(workspace_folder, 'materials', texture_path + extension)
-                if os.path.exists(direct_path):
-                    print(f"Found texture (direct construction): {direct_path}")
-                    return direct_path
-
-            for pattern in search_patterns:
-                # Try direct path construction first
-                direct_path = os.path.join(workspace_folder, pattern)
-                if os.path.exists(direct_path):
-                    print(f"Found texture (direct): {direct_path}")
-                    return direct_path
-
-                # Walk through the workspace folder looking for the texture
-                for root, dirs, files in os.walk(workspace_folder):
-                    # Check if any file matches our pattern
-                    for file in files:
-                        if file.lower() == os.path.basename(pattern).lower():
-                            full_path = os.path.join(root, file)
-                            print(f"Found texture: {full_path}")
-                            return full_path
-
-                        # Also check if the full relative path matches
-                        try:
-                            rel_path = os.path.relpath(os.path.join(root, file), workspace_folder)
-                            rel_path = rel_path.replace('\\', '/')
-                            if rel_path.lower() == pattern.lower():
-                                full_path = os.path.join(root, file)
-                                print(f"Found texture (relative path match): {full_path}")
-                                return full_path
-                        except ValueError:
-                            # Can happen if paths are on different drives
-                            continue
-
-        print(f"Texture not found in workspace: {texture_path}{extension}")
-        return None
+        self._workspace_index[workspace_folder] = index
+        return index
 
     def show_related_textures_info(self):
         """Show a dialog with information about all related textures."""
@@ -4,6 +4,7 @@ Utility functions and classes shared across tools.
 
 import os
 import json
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog
 
@@ -33,6 +34,7 @@ _SURFACE_KEYWORDS = {
 }
 
 
+@lru_cache(maxsize=None)
 def determine_surfaceprop(name: str) -> str:
     """Automatically determine surface property based on filename."""
     ln = name.lower()
@@ -60,6 +62,27 @@ def save_config(cfg):
         print("[WARN] Could not save config:", e)
 
 
+def iter_files(root, suffixes=None):
+    """
+    Yield os.DirEntry objects for files under root using os.scandir.
+    
+    Args:
+        root: Directory to search recursively
+        suffixes: Optional tuple of lowercase extensions (e.g. ('.smd',)) to filter by
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and (suffixes is None or entry.name.lower().endswith(suffixes)):
+                        yield entry
+        except OSError:
+            continue
+
+
 class PlaceholderEntry(ttk.Entry):
     """
     Enhanced ttk.Entry with drag-and-drop support and placeholder text.